@@ -13,7 +13,7 @@ from .models import (
     install_component, remove_component,
     create_connection, get_connections_for_component,
     get_connected_components, remove_connection,
-    add_maintenance_log, get_maintenance_logs
+    add_maintenance_log, add_maintenance_logs, get_maintenance_logs
 )
 
 __all__ = [
@@ -28,5 +28,6 @@ __all__ = [
     'get_connected_components',
     'remove_connection',
     'add_maintenance_log',
+    'add_maintenance_logs',
     'get_maintenance_logs',
 ]
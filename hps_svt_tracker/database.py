@@ -5,6 +5,8 @@ This module handles database initialization, schema creation, and connection man
 """
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -15,24 +17,158 @@ DEFAULT_DB_PATH = os.path.expanduser("~/.hps_svt_tracker/svt_components.db")
 DEFAULT_DATA_DIR = os.path.expanduser("~/.hps_svt_tracker/test_data")
 
 
+# Per-connection settings applied when a thread opens its connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+)
+
+
+# WAL mode lets readers run alongside a writer, but its shared-memory index
+# does not work on network filesystems (NFS/AFS home directories), and the
+# mode is stored in the database file, so it is only used when asked for
+USE_WAL = os.environ.get('SVT_SQLITE_WAL', '').lower() in ('1', 'true', 'yes')
+
+
+# Idle connections kept for reuse by threads that release theirs
+CONNECTION_POOL_SIZE = 25
+
+
+class _Connection(sqlite3.Connection):
+    """
+    Connection whose context manager can be nested.
+
+    A thread reuses one connection, so a helper's `with db.get_connection()`
+    may run inside a block the caller already has open. Only the outermost
+    block commits or rolls back; a nested block that starts while a
+    transaction is open runs in a SAVEPOINT, so an error inside it undoes
+    just its own changes. commit() calls made inside a nested block are left
+    to the outermost one.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # One entry per open block: its SAVEPOINT name, or None
+        self._blocks = []
+
+    def __enter__(self):
+        savepoint = None
+        if self.in_transaction:
+            savepoint = f"svt_block_{len(self._blocks)}"
+            self.execute(f"SAVEPOINT {savepoint}")
+        self._blocks.append(savepoint)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        savepoint = self._blocks.pop()
+        if savepoint is not None:
+            if exc_type is not None:
+                self.execute(f"ROLLBACK TO {savepoint}")
+            self.execute(f"RELEASE {savepoint}")
+        elif not self._blocks:
+            return super().__exit__(exc_type, exc_value, traceback)
+        return False
+
+    def commit(self):
+        if len(self._blocks) > 1 or any(self._blocks):
+            return
+        super().commit()
+
+
 class Database:
     """Database connection and schema management"""
     
-    def __init__(self, db_path: str = DEFAULT_DB_PATH, data_dir: str = DEFAULT_DATA_DIR):
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, data_dir: str = DEFAULT_DATA_DIR,
+                 pool_size: int = CONNECTION_POOL_SIZE, wal: Optional[bool] = None):
         self.db_path = db_path
         self.data_dir = data_dir
+        self.pool_size = pool_size
+        self.wal = USE_WAL if wal is None else wal
+        self._local = threading.local()
+        self._idle = []
+        self._idle_lock = threading.Lock()
         
         # Ensure directories exist
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         os.makedirs(data_dir, exist_ok=True)
         
     def get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with foreign keys enabled"""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        """
+        Get this thread's database connection.
+
+        Each thread takes a connection on first use (an idle pooled one if
+        available) and keeps it until release_connection(), so callers
+        should use it as a context manager (which commits or rolls back
+        once the outermost block exits) rather than closing it.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            with self._idle_lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                       factory=_Connection)
+                for pragma in CONNECTION_PRAGMAS:
+                    conn.execute(pragma)
+                if self.wal:
+                    conn.execute("PRAGMA journal_mode = WAL")
+                conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+            self._local.conn = conn
         return conn
+
+    def release_connection(self):
+        """
+        Hand this thread's connection back to the pool.
+
+        Servers that start a thread per request would otherwise open (and
+        set up) a new connection for every request.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+        self._local.conn = None
+        conn._blocks.clear()
+        if conn.in_transaction:
+            conn.rollback()
+        with self._idle_lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def finish_request(self, error: Optional[BaseException] = None):
+        """Commit or roll back anything left open, then release the connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+        if conn.in_transaction:
+            if error is None:
+                conn.commit()
+            else:
+                conn.rollback()
+        self.release_connection()
     
+    @contextmanager
+    def transaction(self):
+        """
+        Run a block of writes in one BEGIN IMMEDIATE transaction.
+
+        Taking the write lock up front means a concurrent writer makes us
+        wait at BEGIN (within the busy timeout) instead of failing with
+        SQLITE_BUSY halfway through the batch. Commits on success and rolls
+        back if the block raises. Called while a transaction is already open,
+        the block runs in a SAVEPOINT of it instead, so the caller's pending
+        work is neither committed early nor lost to this block's rollback.
+        """
+        conn = self.get_connection()
+        with conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            yield conn
+
     def initialize_schema(self):
         """Create all database tables"""
         with self.get_connection() as conn:
@@ -203,14 +339,18 @@ class Database:
             
             # Create useful indexes
             conn.execute("CREATE INDEX IF NOT EXISTS idx_components_type ON components(type)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_components_type_created ON components(type, created_at DESC, id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_components_status ON components(installation_status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_components_position ON components(installed_position)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_test_results_component ON test_results(component_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_test_results_date ON test_results(test_date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_test_results_type_component_date ON test_results(test_type, component_id, test_date DESC)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_test_files_test ON test_files(test_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_test_files_test_type_date ON test_files(test_id, file_type, upload_date DESC)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_test_files_type ON test_files(file_type)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_installation_history_component ON installation_history(component_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_component_images_component ON component_images(component_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_component_images_upload_date ON component_images(upload_date DESC)")
 
             conn.commit()
     
@@ -236,8 +376,13 @@ class Database:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = f"{self.db_path}.backup_{timestamp}"
         
-        import shutil
-        shutil.copy2(self.db_path, backup_path)
+        # Use the online backup API so changes still in a WAL file (when
+        # WAL mode is on) are included; a plain file copy would miss them
+        target = sqlite3.connect(backup_path)
+        try:
+            self.get_connection().backup(target)
+        finally:
+            target.close()
         return backup_path
 
 
@@ -4,7 +4,9 @@ Image analysis utilities for extracting measurements from microscope images.
 This module provides OCR-based extraction of measurements from images
 produced by microscope software (e.g., edge imaging analysis).
 """
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
@@ -229,14 +231,20 @@ def extract_edge_measurements(image_path: str) -> Dict[str, Any]:
     return result
 
 
-def extract_measurements_from_multiple_images(image_paths: List[str]) -> Dict[str, Any]:
+def extract_measurements_from_multiple_images(
+        image_paths: List[str],
+        original_filenames: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     """
     Extract measurements from multiple edge imaging analysis images.
 
-    Useful when multiple images are uploaded for a single test.
+    Useful when multiple images are uploaded for a single test. Images are
+    processed concurrently: pytesseract runs each OCR pass in a separate
+    tesseract process, so threads are enough to keep several cores busy.
 
     Args:
         image_paths: List of paths to image files
+        original_filenames: Optional dict mapping a path to the name to
+                            report it under (e.g. the uploaded filename)
 
     Returns:
         Dict containing:
@@ -257,9 +265,16 @@ def extract_measurements_from_multiple_images(image_paths: List[str]) -> Dict[st
     all_values = []
     unit = 'um'
 
-    for path in image_paths:
-        filename = Path(path).name
-        extraction = extract_edge_measurements(path)
+    if len(image_paths) > 1:
+        workers = min(len(image_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            extractions = list(executor.map(extract_edge_measurements, image_paths))
+    else:
+        extractions = [extract_edge_measurements(path) for path in image_paths]
+
+    original_filenames = original_filenames or {}
+    for path, extraction in zip(image_paths, extractions):
+        filename = original_filenames.get(path) or Path(path).name
         result['images'][filename] = extraction
 
         if extraction['success']:
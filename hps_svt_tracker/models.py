@@ -5,14 +5,64 @@ This module provides classes and functions for working with components,
 test results, and other database entities.
 """
 import json
+import math
 import os
 import shutil
+import sqlite3
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 
 from .database import Database, get_default_db
 
+# Use orjson's faster encoder when it is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _finite(obj: Any) -> Any:
+    """Replace NaN and infinite floats with None, as orjson writes them"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _json_dumps(obj: Any) -> str:
+    """
+    Serialize a value for a *_json column.
+
+    orjson handles numpy scalars and arrays directly; anything it rejects
+    (e.g. non-string dict keys) falls back to the standard encoder. Either
+    way the result is standard JSON: NaN and infinities are stored as null.
+    Rows written before orjson was used may still contain bare NaN tokens.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            pass
+    return json.dumps(_finite(obj), allow_nan=False)
+
+
+def _connection(db: Optional[Database], conn: Optional[sqlite3.Connection]):
+    """
+    Context manager for a query: the caller's connection if one is given
+    (so several lookups share one transaction), otherwise a new block on db.
+    """
+    if conn is not None:
+        return nullcontext(conn)
+    if db is None:
+        db = get_default_db()
+    return db.get_connection()
+
 
 class Component:
     """Represents a component in the SVT system"""
@@ -77,7 +127,7 @@ class Component:
             'installed_position': self.installed_position,
             'assembled_sensor_id': self.assembled_sensor_id,
             'assembled_hybrid_id': self.assembled_hybrid_id,
-            'attributes_json': json.dumps(self.attributes) if self.attributes else None,
+            'attributes_json': _json_dumps(self.attributes) if self.attributes else None,
             'notes': self.notes,
         }
     
@@ -135,12 +185,10 @@ class Component:
             conn.commit()
     
     @classmethod
-    def get(cls, component_id: str, db: Optional[Database] = None) -> Optional['Component']:
+    def get(cls, component_id: str, db: Optional[Database] = None,
+            conn: Optional[sqlite3.Connection] = None) -> Optional['Component']:
         """Retrieve a component by ID"""
-        if db is None:
-            db = get_default_db()
-        
-        with db.get_connection() as conn:
+        with _connection(db, conn) as conn:
             row = conn.execute(
                 "SELECT * FROM components WHERE id = ?", (component_id,)
             ).fetchone()
@@ -174,6 +222,71 @@ class Component:
             rows = conn.execute(query, params).fetchall()
             return [cls.from_row(dict(row)) for row in rows]
     
+    @classmethod
+    def exists(cls, component_id: str, db: Optional[Database] = None,
+               conn: Optional[sqlite3.Connection] = None) -> bool:
+        """Check whether a component ID exists, without loading the component"""
+        with _connection(db, conn) as conn:
+            return conn.execute(
+                "SELECT 1 FROM components WHERE id = ?", (component_id,)
+            ).fetchone() is not None
+
+    @classmethod
+    def get_install_state(cls, component_id: str, db: Optional[Database] = None,
+                          conn: Optional[sqlite3.Connection] = None
+                          ) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """
+        Get (installation_status, installed_position) for a component.
+
+        Returns None if the component does not exist.
+        """
+        with _connection(db, conn) as conn:
+            row = conn.execute(
+                "SELECT installation_status, installed_position FROM components WHERE id = ?",
+                (component_id,)
+            ).fetchone()
+            return tuple(row) if row else None
+
+    @classmethod
+    def get_type(cls, component_id: str, db: Optional[Database] = None,
+                 conn: Optional[sqlite3.Connection] = None) -> Optional[str]:
+        """Get a component's type, or None if the component does not exist"""
+        with _connection(db, conn) as conn:
+            row = conn.execute(
+                "SELECT type FROM components WHERE id = ?", (component_id,)
+            ).fetchone()
+            return row[0] if row else None
+
+    @classmethod
+    def list_ids(cls, component_type: Optional[str] = None,
+                 db: Optional[Database] = None) -> List[str]:
+        """List component IDs, in the same order as list_all"""
+        if db is None:
+            db = get_default_db()
+
+        query = "SELECT id FROM components"
+        params = []
+
+        if component_type:
+            query += " WHERE type = ?"
+            params.append(component_type)
+
+        query += " ORDER BY created_at DESC"
+
+        with db.get_connection() as conn:
+            return [row['id'] for row in conn.execute(query, params)]
+
+    @classmethod
+    def list_ids_and_status(cls, db: Optional[Database] = None) -> List[Tuple[str, str]]:
+        """List (id, installation_status) pairs, in the same order as list_all"""
+        if db is None:
+            db = get_default_db()
+
+        with db.get_connection() as conn:
+            return [tuple(row) for row in conn.execute(
+                "SELECT id, installation_status FROM components ORDER BY created_at DESC"
+            )]
+
     def delete(self, db: Optional[Database] = None):
         """Delete component from database"""
         if db is None:
@@ -278,6 +391,8 @@ class TestResult:
                     'log': ['path/to/test.log'],
                     'other': ['path/to/other.txt']
                 }
+            file_metadata: Optional dict mapping a file path from ``files`` to
+                a metadata dict, stored with that file's test_files record
         """
         self.component_id = component_id
         self.test_type = test_type
@@ -289,13 +404,30 @@ class TestResult:
         self.test_setup = kwargs.get('test_setup')
         self.test_conditions = kwargs.get('test_conditions')
         self.notes = kwargs.get('notes')
+        self.file_metadata = kwargs.get('file_metadata') or {}
 
         # Will be populated when saved
         self.id = None
         self.stored_files = []  # List of stored file records
+        self._file_rows = None  # test_files rows, once files are stored
 
-    def save(self, db: Optional[Database] = None):
-        """Save test result to database and copy files to organized storage"""
+    def save(self, db: Optional[Database] = None, move_files: bool = False,
+             conn: Optional[sqlite3.Connection] = None):
+        """
+        Save test result to database and copy files to organized storage
+
+        Args:
+            db: Database instance
+            move_files: Move the files into storage instead of copying them.
+                For callers whose files are scratch copies (e.g. web uploads
+                spooled under data_dir), this is a rename rather than a
+                second full write.
+            conn: Connection with a transaction the caller has already
+                opened (see Database.transaction). The rows are inserted
+                there and the caller commits, so a batch of results shares
+                one commit. If that transaction is rolled back, the caller
+                should call remove_stored_files().
+        """
         if db is None:
             db = get_default_db()
 
@@ -324,88 +456,149 @@ class TestResult:
             'current_measured': current,
             'noise_level': noise,
             'temperature': temp,
-            'measurements_json': json.dumps(self.measurements) if self.measurements else None,
+            'measurements_json': _json_dumps(self.measurements) if self.measurements else None,
             'tested_by': self.tested_by,
             'test_setup': self.test_setup,
             'test_conditions': self.test_conditions,
             'notes': self.notes,
         }
 
-        with db.get_connection() as conn:
-            columns = ", ".join(data.keys())
-            placeholders = ", ".join(["?" for _ in data])
-            cursor = conn.execute(
-                f"INSERT INTO test_results ({columns}) VALUES ({placeholders})",
-                list(data.values())
-            )
-            self.id = cursor.lastrowid
-            conn.commit()
+        # Put files in storage first (the location depends only on the test
+        # date), so the write transaction below holds the lock only for the
+        # inserts and never for file I/O
+        self.store_files(db, move_files)
 
-        # Store files after we have the test ID
-        if self.files:
-            self._store_files(db)
+        if conn is not None:
+            self._insert(conn, data, self._file_rows)
+        else:
+            try:
+                with db.transaction() as conn:
+                    self._insert(conn, data, self._file_rows)
+            except BaseException:
+                self.remove_stored_files(db)
+                raise
 
         return self.id
 
-    def _store_files(self, db: Database):
-        """Copy files to organized storage and record in test_files table"""
+    def store_files(self, db: Optional[Database] = None, move_files: bool = False):
+        """
+        Put the test's files in organized storage ahead of save()
+
+        save() does this itself; callers recording several results in one
+        transaction call it first so that no file I/O happens while they
+        hold the write lock. Does nothing if the files are already stored.
+        """
+        if self._file_rows is not None:
+            return
+        if db is None:
+            db = get_default_db()
+
+        try:
+            self._file_rows = self._store_files(db, move_files) if self.files else []
+        except BaseException:
+            self.remove_stored_files(db)
+            raise
+
+    def remove_stored_files(self, db: Optional[Database] = None):
+        """Delete the stored copies of the files, e.g. when the insert was rolled back"""
+        if db is None:
+            db = get_default_db()
+
+        for record in self.stored_files:
+            try:
+                os.remove(os.path.join(db.data_dir, record['file_path']))
+            except FileNotFoundError:
+                pass
+        self.stored_files = []
+        self._file_rows = None
+
+    def _insert(self, conn: sqlite3.Connection, data: Dict[str, Any], file_rows):
+        """Insert the test_results row and its test_files rows"""
+        columns = ", ".join(data.keys())
+        placeholders = ", ".join(["?" for _ in data])
+        cursor = conn.execute(
+            f"INSERT INTO test_results ({columns}) VALUES ({placeholders})",
+            list(data.values())
+        )
+        self.id = cursor.lastrowid
+
+        if file_rows:
+            conn.executemany("""
+                INSERT INTO test_files
+                (test_id, file_type, file_path, original_filename, file_size,
+                 metadata_json)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [(self.id, *row) for row in file_rows])
+
+    def _store_files(self, db: Database, move_files: bool = False):
+        """
+        Copy (or move) files to organized storage
+
+        Returns:
+            List of (file_type, file_path, original_filename, file_size,
+            metadata_json) tuples for the test_files table
+        """
         # Create storage directory: data_dir/YYYY/component_id/YYYYMMDD_HHMMSS_testtype/
-        test_dir = os.path.join(
-            db.data_dir,
+        # The relative path stored in the database is built alongside it
+        # rather than re-derived per file with os.path.relpath
+        rel_test_dir = os.path.join(
             self.test_date.strftime("%Y"),
             self.component_id,
             f"{self.test_date.strftime('%Y%m%d_%H%M%S')}_{self.test_type}"
         )
+        test_dir = os.path.join(db.data_dir, rel_test_dir)
 
-        with db.get_connection() as conn:
-            for file_type, file_paths in self.files.items():
-                if file_type not in self.FILE_TYPES:
-                    print(f"Warning: Invalid file type '{file_type}', skipping")
-                    continue
+        file_rows = []
+        for file_type, file_paths in self.files.items():
+            if file_type not in self.FILE_TYPES:
+                print(f"Warning: Invalid file type '{file_type}', skipping")
+                continue
 
-                # Create subdirectory for this file type
-                type_dir = os.path.join(test_dir, file_type)
-                os.makedirs(type_dir, exist_ok=True)
+            # Create subdirectory for this file type
+            type_dir = os.path.join(test_dir, file_type)
+            os.makedirs(type_dir, exist_ok=True)
 
-                for file_path in file_paths:
-                    if not os.path.exists(file_path):
-                        print(f"Warning: File not found: {file_path}")
-                        continue
-
-                    # Get original filename and size
-                    original_filename = Path(file_path).name
-                    file_size = os.path.getsize(file_path)
-
-                    # Copy file to storage
-                    dest_path = os.path.join(type_dir, original_filename)
-
-                    # Handle duplicate filenames
-                    counter = 1
-                    while os.path.exists(dest_path):
-                        name, ext = os.path.splitext(original_filename)
-                        dest_path = os.path.join(type_dir, f"{name}_{counter}{ext}")
-                        counter += 1
+            for file_path in file_paths:
+                if not os.path.exists(file_path):
+                    print(f"Warning: File not found: {file_path}")
+                    continue
 
+                # Get original filename and size
+                original_filename = os.path.basename(file_path)
+                file_size = os.path.getsize(file_path)
+
+                # Copy file to storage
+                dest_name = original_filename
+                dest_path = os.path.join(type_dir, dest_name)
+
+                # Handle duplicate filenames
+                counter = 1
+                while os.path.exists(dest_path):
+                    name, ext = os.path.splitext(original_filename)
+                    dest_name = f"{name}_{counter}{ext}"
+                    dest_path = os.path.join(type_dir, dest_name)
+                    counter += 1
+
+                if move_files:
+                    shutil.move(file_path, dest_path)
+                else:
                     shutil.copy2(file_path, dest_path)
 
-                    # Store relative path
-                    rel_path = os.path.relpath(dest_path, db.data_dir)
+                # Store relative path
+                rel_path = os.path.join(rel_test_dir, file_type, dest_name)
 
-                    # Insert into test_files table
-                    conn.execute("""
-                        INSERT INTO test_files
-                        (test_id, file_type, file_path, original_filename, file_size)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (self.id, file_type, rel_path, original_filename, file_size))
+                metadata = self.file_metadata.get(file_path)
+                file_rows.append((file_type, rel_path, original_filename, file_size,
+                                  _json_dumps(metadata) if metadata else None))
 
-                    self.stored_files.append({
-                        'file_type': file_type,
-                        'file_path': rel_path,
-                        'original_filename': original_filename,
-                        'file_size': file_size
-                    })
+                self.stored_files.append({
+                    'file_type': file_type,
+                    'file_path': rel_path,
+                    'original_filename': original_filename,
+                    'file_size': file_size
+                })
 
-            conn.commit()
+        return file_rows
 
     def add_file(self, file_path: str, file_type: str,
                  description: Optional[str] = None,
@@ -469,7 +662,7 @@ class TestResult:
                  file_size, metadata_json)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (self.id, file_type, rel_path, original_filename, description,
-                  file_size, json.dumps(metadata) if metadata else None))
+                  file_size, _json_dumps(metadata) if metadata else None))
             conn.commit()
             return cursor.lastrowid
     
@@ -543,12 +736,10 @@ class TestResult:
         return result
 
     @classmethod
-    def get_for_component(cls, component_id: str, db: Optional[Database] = None) -> List[Dict[str, Any]]:
+    def get_for_component(cls, component_id: str, db: Optional[Database] = None,
+                          conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
         """Get all test results for a component"""
-        if db is None:
-            db = get_default_db()
-
-        with db.get_connection() as conn:
+        with _connection(db, conn) as conn:
             rows = conn.execute(
                 """SELECT * FROM test_results
                    WHERE component_id = ?
@@ -706,16 +897,14 @@ def create_connection(component_a_id: str, component_b_id: str,
 
 
 def get_connections_for_component(component_id: str,
-                                  db: Optional[Database] = None) -> List[Dict[str, Any]]:
+                                  db: Optional[Database] = None,
+                                  conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
     """
     Get all connections for a component
 
     Returns list of connection records where component appears as either A or B
     """
-    if db is None:
-        db = get_default_db()
-
-    with db.get_connection() as conn:
+    with _connection(db, conn) as conn:
         rows = conn.execute("""
             SELECT * FROM connections
             WHERE component_a_id = ? OR component_b_id = ?
@@ -790,11 +979,6 @@ def add_maintenance_log(component_id: str, description: str,
     if db is None:
         db = get_default_db()
 
-    # Verify component exists
-    component = Component.get(component_id, db)
-    if not component:
-        raise ValueError(f"Component {component_id} not found")
-
     # Validate log_type and severity
     valid_log_types = ['issue', 'repair', 'maintenance', 'note']
     valid_severities = ['critical', 'warning', 'info']
@@ -805,29 +989,94 @@ def add_maintenance_log(component_id: str, description: str,
         raise ValueError(f"Invalid severity: {severity}. Must be one of {valid_severities}")
 
     with db.get_connection() as conn:
-        cursor = conn.execute("""
+        # The foreign key on component_id rejects unknown components, so
+        # there is no separate lookup before the insert
+        try:
+            cursor = conn.execute("""
+                INSERT INTO maintenance_log
+                (component_id, log_date, log_type, severity, description,
+                 resolution, logged_by, image_path)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (component_id, datetime.now().isoformat(), log_type, severity,
+                  description, resolution, logged_by, image_path))
+        except sqlite3.IntegrityError as e:
+            if 'FOREIGN KEY' not in str(e):
+                raise
+            raise ValueError(f"Component {component_id} not found") from e
+
+        conn.commit()
+        return cursor.lastrowid
+
+
+def add_maintenance_logs(entries: List[Dict[str, Any]],
+                         db: Optional[Database] = None) -> int:
+    """
+    Add many maintenance log entries in one transaction
+
+    Intended for scripted backfills: all entries are validated first, then
+    inserted with a single executemany, so it costs one commit instead of
+    one per entry and either all entries are added or none are.
+
+    Args:
+        entries: List of dicts with the keyword arguments of
+                 add_maintenance_log (component_id and description required)
+        db: Database instance
+
+    Returns:
+        Number of log entries added
+    """
+    if db is None:
+        db = get_default_db()
+
+    valid_log_types = ['issue', 'repair', 'maintenance', 'note']
+    valid_severities = ['critical', 'warning', 'info']
+
+    log_date = datetime.now().isoformat()
+    rows = []
+    for entry in entries:
+        log_type = entry.get('log_type', 'note')
+        severity = entry.get('severity', 'info')
+        if log_type not in valid_log_types:
+            raise ValueError(f"Invalid log_type: {log_type}. Must be one of {valid_log_types}")
+        if severity not in valid_severities:
+            raise ValueError(f"Invalid severity: {severity}. Must be one of {valid_severities}")
+        rows.append((entry['component_id'], log_date, log_type, severity,
+                     entry['description'], entry.get('resolution'),
+                     entry.get('logged_by'), entry.get('image_path')))
+
+    if not rows:
+        return 0
+
+    with db.transaction() as conn:
+        # Verify all components exist with one lookup
+        component_ids = sorted({row[0] for row in rows})
+        placeholders = ", ".join("?" for _ in component_ids)
+        found = {r[0] for r in conn.execute(
+            f"SELECT id FROM components WHERE id IN ({placeholders})", component_ids
+        )}
+        missing = [cid for cid in component_ids if cid not in found]
+        if missing:
+            raise ValueError(f"Component {missing[0]} not found")
+
+        conn.executemany("""
             INSERT INTO maintenance_log
             (component_id, log_date, log_type, severity, description,
              resolution, logged_by, image_path)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (component_id, datetime.now().isoformat(), log_type, severity,
-              description, resolution, logged_by, image_path))
+        """, rows)
 
-        conn.commit()
-        return cursor.lastrowid
+    return len(rows)
 
 
 def get_maintenance_logs(component_id: str,
-                        db: Optional[Database] = None) -> List[Dict[str, Any]]:
+                        db: Optional[Database] = None,
+                        conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
     """
     Get all maintenance logs for a component
 
     Returns list of log entries ordered by date (newest first)
     """
-    if db is None:
-        db = get_default_db()
-
-    with db.get_connection() as conn:
+    with _connection(db, conn) as conn:
         rows = conn.execute("""
             SELECT * FROM maintenance_log
             WHERE component_id = ?
@@ -988,21 +1237,20 @@ def disassemble_module(module_id: str,
 
 
 def get_component_images(component_id: str,
-                         db: Optional[Database] = None) -> List[Dict[str, Any]]:
+                         db: Optional[Database] = None,
+                         conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
     """
     Get all images for a component
 
     Args:
         component_id: ID of the component
         db: Database instance
+        conn: Existing connection to run the query on (optional)
 
     Returns:
         List of image records ordered by upload date (newest first)
     """
-    if db is None:
-        db = get_default_db()
-
-    with db.get_connection() as conn:
+    with _connection(db, conn) as conn:
         rows = conn.execute("""
             SELECT * FROM component_images
             WHERE component_id = ?
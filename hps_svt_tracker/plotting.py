@@ -3,19 +3,130 @@ Plotting functions for HPS SVT Component Tracker
 
 Generates summary plots for test results across components.
 """
-import io
+import functools
+import hashlib
 import json
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Tuple
 
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend for server
-import matplotlib.pyplot as plt
 import numpy as np
 
 from .database import Database, get_default_db
-from .models import Component, TestResult
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+
+@functools.lru_cache(maxsize=None)
+def _mpl() -> SimpleNamespace:
+    """
+    Import the matplotlib pieces used here on first use.
+
+    matplotlib takes a noticeable share of start-up time, so it is loaded
+    when the first plot is drawn rather than when the web app (or test
+    suite) imports this module.
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend for server
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure, SubplotParams
+    from matplotlib.patches import Patch
+    from PIL import Image  # Always available: matplotlib depends on Pillow
+    return SimpleNamespace(Figure=Figure, FigureCanvasAgg=FigureCanvasAgg,
+                           SubplotParams=SubplotParams, Patch=Patch,
+                           Image=Image)
+
+
+# Shared plot styles
+_LABEL_KW = {'fontsize': 12}
+_TITLE_KW = {'fontsize': 14, 'fontweight': 'bold'}
+_SUBPLOT_LABEL_KW = {'fontsize': 10}
+_SUBPLOT_TITLE_KW = {'fontsize': 12, 'fontweight': 'bold'}
+_TICK_LABEL_KW = {'rotation': 45, 'ha': 'right'}
+_GRID_KW = {'linestyle': '--', 'alpha': 0.7}
+_OUTLINE_KW = {'edgecolor': 'black', 'linewidth': 0.5}
+_POINT_LABEL_KW = {'fontsize': 7, 'ha': 'left', 'va': 'bottom',
+                   'xytext': (3, 3), 'textcoords': 'offset points'}
+_TEXT_BOX_STYLE = {'boxstyle': 'round', 'facecolor': 'wheat', 'alpha': 0.5}
+_FIT_TEXT_KW = {'fontsize': 9, 'verticalalignment': 'top', 'bbox': _TEXT_BOX_STYLE}
+
+
+# Output resolution for rendered plots; pixel count, and with it encode
+# time and PNG size, scales with its square
+PLOT_DPI = 100
+
+_figures = threading.local()
+
+
+def _new_figure(figsize: Tuple[float, float]) -> 'Figure':
+    """
+    Get a cleared Agg figure for the calling thread.
+
+    Figures are built without pyplot so that no global figure state is
+    shared, which keeps plot generation safe to run from several threads.
+    Each thread keeps one figure and canvas and reuses it between renders
+    instead of rebuilding them on every request.
+    """
+    mpl = _mpl()
+    fig = getattr(_figures, 'fig', None)
+    if fig is None:
+        fig = _figures.fig = mpl.Figure(figsize=figsize, dpi=PLOT_DPI)
+        mpl.FigureCanvasAgg(fig)
+    else:
+        fig.clear()
+        fig.subplotpars = mpl.SubplotParams()
+        fig.set_size_inches(figsize)
+    return fig
+
+
+# zlib level 3 encodes several times faster than the default level 6 for
+# these mostly flat-colour plots at a modest size cost
+PNG_COMPRESS_LEVEL = 3
+
+# Plots use far fewer distinct colours than this, so an adaptive 8-bit
+# palette is visually lossless and about a third the size of RGBA
+PNG_PALETTE_COLORS = 256
+
+
+class _PNGSink(bytearray):
+    """Write-only file object that appends encoded chunks in place"""
+
+    def write(self, data) -> int:
+        self.extend(data)
+        return len(data)
+
+
+def _figure_to_png(fig: 'Figure') -> bytes:
+    """Render a figure to a palette (8-bit) PNG"""
+    Image = _mpl().Image
+    fig.canvas.draw()
+    image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB')
+    # 2 is FASTOCTREE; the Image.Quantize enum only exists from Pillow 9.1
+    image = image.quantize(colors=PNG_PALETTE_COLORS, method=2)
+
+    buf = _PNGSink()
+    image.save(buf, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+    return bytes(buf)
+
+
+@functools.lru_cache(maxsize=None)
+def _empty_plot_png(message: str) -> bytes:
+    """
+    Render a small placeholder image for a plot with no data.
+
+    Built once per message and reused, so empty plots skip the full
+    figure layout and encoding work.
+    """
+    fig = _new_figure((4, 2))
+    fig.text(0.5, 0.5, message, ha='center', va='center',
+             fontsize=11, color='gray')
+    return _figure_to_png(fig)
 
 
 # =============================================================================
@@ -175,24 +286,25 @@ def generate_iv_curve_plot(voltage: np.ndarray, current: np.ndarray,
     # Take absolute value of current and convert to µA
     current_ua = np.abs(current) * 1e6
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = _new_figure((10, 6))
+    ax = fig.subplots()
 
     # Plot IV curve
     ax.plot(voltage, current_ua, 'b-', linewidth=1.5, marker='o', markersize=4)
 
     # Labels and title
-    ax.set_xlabel('Bias Voltage (V)', fontsize=12)
-    ax.set_ylabel('Leakage Current (µA)', fontsize=12)
+    ax.set_xlabel('Bias Voltage (V)', **_LABEL_KW)
+    ax.set_ylabel('Leakage Current (µA)', **_LABEL_KW)
 
     if title:
-        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_title(title, **_TITLE_KW)
     elif component_id:
-        ax.set_title(f'IV Curve - {component_id}', fontsize=14, fontweight='bold')
+        ax.set_title(f'IV Curve - {component_id}', **_TITLE_KW)
     else:
-        ax.set_title('IV Curve', fontsize=14, fontweight='bold')
+        ax.set_title('IV Curve', **_TITLE_KW)
 
     # Grid
-    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.grid(True, **_GRID_KW)
 
     # Add annotation - prefer 100V if it exists, otherwise use max voltage
     annotation_idx = None
@@ -213,18 +325,12 @@ def generate_iv_curve_plot(voltage: np.ndarray, current: np.ndarray,
                 xy=(annotation_voltage, current_at_annotation),
                 xytext=(0.7, 0.9), textcoords='axes fraction',
                 fontsize=10,
-                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5),
+                bbox=_TEXT_BOX_STYLE,
                 arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.2'))
 
-    plt.tight_layout()
-
-    # Save to bytes
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    plt.close(fig)
+    fig.tight_layout()
 
-    return buf.getvalue()
+    return _figure_to_png(fig)
 
 
 def analyze_iv_file(file_path: str, component_id: str = None) -> Dict[str, Any]:
@@ -262,15 +368,205 @@ def analyze_iv_file(file_path: str, component_id: str = None) -> Dict[str, Any]:
         }
 
 
+# =============================================================================
+# Summary Plot Data
+# =============================================================================
+
+# CNM attribute keys stored on sensor components
+CENTRE_KEY = 'Centre distance to the cleaving path (µm)'
+EDGE_A_KEY = 'EDGE A distance to the cleaving path (µm)'
+EDGE_B_KEY = 'EDGE B distance to the cleaving path (µm)'
+WAFER_KEY = 'L.C. @ 100V on wafer (A/cm2)'
+CLEAVED_KEY = 'L.C. @ 100V cleaved (A/cm2)'
+
+# Edge imaging measurement fields used by the summary plots
+EDGE_MEASUREMENT_KEYS = (
+    'edge_gap_mean', 'edge_gap_min', 'edge_gap_max',
+    'edge_gap_l_mean', 'edge_gap_c_mean', 'edge_gap_r_mean',
+    'edge_slope_um_per_mm', 'edge_fit_r_squared', 'edge_angle_deg',
+)
+
+
+@dataclass
+class DashboardBundle:
+    """
+    Sensor data shared by the summary plot generators.
+
+    Each entry in ``sensors`` is a dict with:
+    - sensor_id: Component ID
+    - attributes: Parsed attributes dict
+    - edge_test: Latest edge imaging test as a dict with test_date,
+      pass_fail and measurements (EDGE_MEASUREMENT_KEYS values), or None
+      if the sensor has no usable edge imaging test
+
+    ``version`` is a digest of the underlying rows; it changes whenever
+    any data feeding the plots changes.
+    """
+    sensors: List[Dict[str, Any]] = field(default_factory=list)
+    version: str = ''
+
+
+def load_dashboard_bundle(db: Optional[Database] = None) -> DashboardBundle:
+    """
+    Load every sensor together with its latest edge imaging test.
+
+    A single query replaces the per-generator ``Component.list_all`` call
+    and the per-sensor ``TestResult.get_for_component`` lookups, so one
+    bundle can feed all of the summary plots. The latest test per sensor
+    is picked with a window function in one pass over test_results, and
+    only the measurement fields the plots use are pulled out of the JSON
+    column with json_extract.
+
+    Args:
+        db: Database instance
+
+    Returns:
+        DashboardBundle with one entry per sensor, ordered by sensor ID
+    """
+    if db is None:
+        db = get_default_db()
+
+    # Attributes stay parsed in Python: their keys contain non-ASCII
+    # characters that json.dumps stores escaped, which json_extract paths
+    # do not match on older SQLite versions
+    measurement_columns = ", ".join(
+        "json_extract(t.measurements_json, ?)" for _ in EDGE_MEASUREMENT_KEYS)
+    params = [f'$.{key}' for key in EDGE_MEASUREMENT_KEYS]
+
+    with db.get_connection() as conn:
+        rows = conn.execute(
+            f"""SELECT c.id, c.attributes_json, t.id, t.test_date, t.pass_fail, t.bad_json,
+                       {measurement_columns}
+                FROM components c
+                LEFT JOIN (
+                    SELECT id, component_id, test_date, pass_fail,
+                           CASE WHEN json_valid(measurements_json) THEN measurements_json END
+                               AS measurements_json,
+                           CASE WHEN measurements_json != '' AND NOT json_valid(measurements_json)
+                                THEN measurements_json END AS bad_json,
+                           ROW_NUMBER() OVER (PARTITION BY component_id
+                                              ORDER BY test_date DESC) AS rn
+                    FROM test_results
+                    WHERE test_type = 'edge_imaging'
+                ) t ON t.component_id = c.id AND t.rn = 1
+                WHERE c.type = 'sensor'
+                ORDER BY c.id""",
+            params
+        ).fetchall()
+
+    digest = hashlib.blake2b(digest_size=16)
+    sensors = []
+    for row in rows:
+        digest.update(repr(tuple(row)).encode())
+        sensor_id, attributes_json, test_id, test_date, pass_fail, bad_json = row[:6]
+
+        # New rows store NaN/Infinity as null, but SQLite's JSON functions
+        # reject the bare NaN/Infinity that json.dumps wrote into older
+        # rows, so those are parsed here; tests whose
+        # measurements cannot be parsed at all are treated as missing
+        edge_test = None
+        measurements = None
+        if bad_json:
+            try:
+                parsed = json.loads(bad_json)
+            except ValueError:
+                parsed = None
+            if isinstance(parsed, dict):
+                measurements = {key: parsed.get(key) for key in EDGE_MEASUREMENT_KEYS}
+        elif test_id is not None:
+            measurements = dict(zip(EDGE_MEASUREMENT_KEYS, row[6:]))
+
+        if measurements is not None:
+            edge_test = {
+                'test_date': test_date,
+                'pass_fail': pass_fail,
+                'measurements': measurements,
+            }
+
+        sensors.append({
+            'sensor_id': sensor_id,
+            'attributes': json.loads(attributes_json) if attributes_json else {},
+            'edge_test': edge_test,
+        })
+
+    return DashboardBundle(sensors=sensors, version=digest.hexdigest())
+
+
+def _column(plot_data: List[Dict[str, Any]], key: str) -> np.ndarray:
+    """Build a float array for one plot_data field, with NaN for missing values"""
+    return np.array([d[key] if d[key] is not None else np.nan for d in plot_data],
+                    dtype=float)
+
+
+def _float_or_none(value: Any) -> Optional[float]:
+    """Convert an attribute value to float, returning None if not numeric"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Number of cached results kept per summary plot generator
+PLOT_CACHE_SIZE = 16
+
+# Rendering is CPU bound and mostly holds the GIL, so running more renders
+# at once than there are cores only makes each of them slower
+_render_slots = threading.BoundedSemaphore(os.cpu_count() or 1)
+
+
+def _memoize_plot(generator):
+    """
+    Cache a summary plot generator's output by bundle version.
+
+    Rendering dominates the cost of these plots, so repeat requests for
+    unchanged data return the stored (PNG bytes, plot_data) result and
+    skip matplotlib entirely. The returned plot_data is shared between
+    callers and must be treated as read-only.
+    """
+    cache = OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(generator)
+    def wrapper(db: Optional[Database] = None,
+                bundle: Optional[DashboardBundle] = None):
+        if bundle is None:
+            bundle = load_dashboard_bundle(db)
+
+        with lock:
+            if bundle.version in cache:
+                cache.move_to_end(bundle.version)
+                return cache[bundle.version]
+
+        with _render_slots:
+            result = generator(bundle=bundle)
+
+        with lock:
+            cache[bundle.version] = result
+            while len(cache) > PLOT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
 # =============================================================================
 # Summary Plot Functions
 # =============================================================================
 
 
-def generate_edge_imaging_summary(db: Optional[Database] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
+@_memoize_plot
+def generate_edge_imaging_summary(db: Optional[Database] = None,
+                                  bundle: Optional[DashboardBundle] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
     """
     Generate a summary plot of edge imaging test results across all sensors.
 
+    Args:
+        db: Database instance (used when no bundle is given)
+        bundle: Preloaded sensor data from load_dashboard_bundle
+
     Returns:
         Tuple of (PNG image bytes, list of sensor data included in plot)
 
@@ -278,35 +574,18 @@ def generate_edge_imaging_summary(db: Optional[Database] = None) -> Tuple[bytes,
     - Data point at edge_gap_mean
     - Error bars from edge_gap_min to edge_gap_max
     """
-    if db is None:
-        db = get_default_db()
-
-    # Get all sensors
-    sensors = Component.list_all(component_type='sensor', db=db)
+    if bundle is None:
+        bundle = load_dashboard_bundle(db)
 
     # Collect data for each sensor
     plot_data = []
 
-    for sensor in sensors:
-        # Get all test results for this sensor
-        tests = TestResult.get_for_component(sensor.id, db=db)
-
-        # Filter to edge_imaging tests only
-        edge_tests = [t for t in tests if t['test_type'] == 'edge_imaging']
-
-        if not edge_tests:
+    for sensor in bundle.sensors:
+        latest_test = sensor['edge_test']
+        if latest_test is None:
             continue
 
-        # Get the most recent edge imaging test
-        latest_test = edge_tests[0]  # Already sorted by test_date DESC
-
-        # Parse measurements
-        measurements = {}
-        if latest_test['measurements_json']:
-            try:
-                measurements = json.loads(latest_test['measurements_json'])
-            except json.JSONDecodeError:
-                continue
+        measurements = latest_test['measurements']
 
         # Extract edge gap values
         edge_gap_mean = measurements.get('edge_gap_mean')
@@ -318,7 +597,7 @@ def generate_edge_imaging_summary(db: Optional[Database] = None) -> Tuple[bytes,
             continue
 
         plot_data.append({
-            'sensor_id': sensor.id,
+            'sensor_id': sensor['sensor_id'],
             'mean': edge_gap_mean,
             'min': edge_gap_min if edge_gap_min is not None else edge_gap_mean,
             'max': edge_gap_max if edge_gap_max is not None else edge_gap_mean,
@@ -326,59 +605,49 @@ def generate_edge_imaging_summary(db: Optional[Database] = None) -> Tuple[bytes,
             'pass_fail': latest_test['pass_fail']
         })
 
-    # Sort by sensor ID for consistent ordering
-    plot_data.sort(key=lambda x: x['sensor_id'])
+    if not plot_data:
+        return _empty_plot_png('No edge imaging test data available'), plot_data
 
     # Create the plot
-    fig, ax = plt.subplots(figsize=(max(10, len(plot_data) * 0.8), 6))
+    fig = _new_figure((max(10, len(plot_data) * 0.8), 6))
+    ax = fig.subplots()
 
-    if not plot_data:
-        ax.text(0.5, 0.5, 'No edge imaging test data available',
-                ha='center', va='center', transform=ax.transAxes,
-                fontsize=14, color='gray')
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-    else:
-        # Prepare data for plotting
-        x_positions = range(len(plot_data))
-        means = [d['mean'] for d in plot_data]
-        labels = [d['sensor_id'] for d in plot_data]
+    # Prepare data for plotting
+    x_positions = range(len(plot_data))
+    means = [d['mean'] for d in plot_data]
+    labels = [d['sensor_id'] for d in plot_data]
 
-        # Calculate asymmetric error bars
-        yerr_lower = [d['mean'] - d['min'] for d in plot_data]
-        yerr_upper = [d['max'] - d['mean'] for d in plot_data]
+    # Calculate asymmetric error bars
+    yerr_lower = [d['mean'] - d['min'] for d in plot_data]
+    yerr_upper = [d['max'] - d['mean'] for d in plot_data]
 
-        # Plot with error bars
-        ax.errorbar(x_positions, means, yerr=[yerr_lower, yerr_upper],
-                   fmt='o', markersize=8, capsize=5, capthick=2,
-                   color='#1f77b4', ecolor='#1f77b4', elinewidth=2)
+    # Plot with error bars
+    ax.errorbar(x_positions, means, yerr=[yerr_lower, yerr_upper],
+               fmt='o', markersize=8, capsize=5, capthick=2,
+               color='#1f77b4', ecolor='#1f77b4', elinewidth=2)
 
-        # Customize axes
-        ax.set_xticks(x_positions)
-        ax.set_xticklabels(labels, rotation=45, ha='right')
-        ax.set_xlabel('Sensor ID', fontsize=12)
-        ax.set_ylabel('Edge Gap (um)', fontsize=12)
-        ax.set_title('Edge Imaging Results by Sensor', fontsize=14, fontweight='bold')
+    # Customize axes
+    ax.set_xticks(x_positions)
+    ax.set_xticklabels(labels, **_TICK_LABEL_KW)
+    ax.set_xlabel('Sensor ID', **_LABEL_KW)
+    ax.set_ylabel('Edge Gap (um)', **_LABEL_KW)
+    ax.set_title('Edge Imaging Results by Sensor', **_TITLE_KW)
 
-        # Add grid for readability
-        ax.grid(True, axis='y', linestyle='--', alpha=0.7)
-        ax.set_axisbelow(True)
+    # Add grid for readability
+    ax.grid(True, axis='y', **_GRID_KW)
+    ax.set_axisbelow(True)
 
-        # Add some padding
-        ax.margins(x=0.05)
+    # Add some padding
+    ax.margins(x=0.05)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save to bytes
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    plt.close(fig)
+    return _figure_to_png(fig), plot_data
 
-    return buf.getvalue(), plot_data
 
-
-def generate_cleaving_distance_plot(db: Optional[Database] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
+@_memoize_plot
+def generate_cleaving_distance_plot(db: Optional[Database] = None,
+                                    bundle: Optional[DashboardBundle] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
     """
     Generate a scatter plot of cleaving path distances across all sensors.
 
@@ -387,115 +656,88 @@ def generate_cleaving_distance_plot(db: Optional[Database] = None) -> Tuple[byte
     - EDGE A distance to the cleaving path
     - EDGE B distance to the cleaving path
 
+    Args:
+        db: Database instance (used when no bundle is given)
+        bundle: Preloaded sensor data from load_dashboard_bundle
+
     Returns:
         Tuple of (PNG image bytes, list of sensor data included in plot)
     """
-    if db is None:
-        db = get_default_db()
-
-    # Attribute keys
-    CENTRE_KEY = 'Centre distance to the cleaving path (µm)'
-    EDGE_A_KEY = 'EDGE A distance to the cleaving path (µm)'
-    EDGE_B_KEY = 'EDGE B distance to the cleaving path (µm)'
-
-    # Get all sensors
-    sensors = Component.list_all(component_type='sensor', db=db)
+    if bundle is None:
+        bundle = load_dashboard_bundle(db)
 
     # Collect data for each sensor
     plot_data = []
 
-    for sensor in sensors:
-        centre = sensor.get_attribute(CENTRE_KEY)
-        edge_a = sensor.get_attribute(EDGE_A_KEY)
-        edge_b = sensor.get_attribute(EDGE_B_KEY)
-
-        # Skip if none of the values are present
-        if centre is None and edge_a is None and edge_b is None:
-            continue
-
-        # Convert to float where possible
-        try:
-            centre = float(centre) if centre is not None else None
-        except (ValueError, TypeError):
-            centre = None
-        try:
-            edge_a = float(edge_a) if edge_a is not None else None
-        except (ValueError, TypeError):
-            edge_a = None
-        try:
-            edge_b = float(edge_b) if edge_b is not None else None
-        except (ValueError, TypeError):
-            edge_b = None
+    for sensor in bundle.sensors:
+        attributes = sensor['attributes']
+        centre = _float_or_none(attributes.get(CENTRE_KEY))
+        edge_a = _float_or_none(attributes.get(EDGE_A_KEY))
+        edge_b = _float_or_none(attributes.get(EDGE_B_KEY))
 
         if centre is None and edge_a is None and edge_b is None:
             continue
 
         plot_data.append({
-            'sensor_id': sensor.id,
+            'sensor_id': sensor['sensor_id'],
             'centre': centre,
             'edge_a': edge_a,
             'edge_b': edge_b,
         })
 
-    # Sort by sensor ID for consistent ordering
-    plot_data.sort(key=lambda x: x['sensor_id'])
-
-    # Create the plot
-    fig, ax = plt.subplots(figsize=(max(10, len(plot_data) * 0.8), 6))
-
     if not plot_data:
-        ax.text(0.5, 0.5, 'No cleaving distance data available',
-                ha='center', va='center', transform=ax.transAxes,
-                fontsize=14, color='gray')
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-    else:
-        x_positions = list(range(len(plot_data)))
-        labels = [d['sensor_id'] for d in plot_data]
-
-        # Plot each series with slight x offset for visibility
-        offset = 0.15
-
-        # Centre
-        centre_vals = [(i, d['centre']) for i, d in enumerate(plot_data) if d['centre'] is not None]
-        if centre_vals:
-            ax.scatter([x - offset for x, _ in centre_vals], [v for _, v in centre_vals],
-                      s=60, marker='o', color='#1f77b4', label='Centre', zorder=3)
-
-        # Edge A
-        edge_a_vals = [(i, d['edge_a']) for i, d in enumerate(plot_data) if d['edge_a'] is not None]
-        if edge_a_vals:
-            ax.scatter([x for x, _ in edge_a_vals], [v for _, v in edge_a_vals],
-                      s=60, marker='s', color='#2ca02c', label='Edge A', zorder=3)
-
-        # Edge B
-        edge_b_vals = [(i, d['edge_b']) for i, d in enumerate(plot_data) if d['edge_b'] is not None]
-        if edge_b_vals:
-            ax.scatter([x + offset for x, _ in edge_b_vals], [v for _, v in edge_b_vals],
-                      s=60, marker='^', color='#d62728', label='Edge B', zorder=3)
+        return _empty_plot_png('No cleaving distance data available'), plot_data
 
-        ax.set_xticks(x_positions)
-        ax.set_xticklabels(labels, rotation=45, ha='right')
-        ax.set_xlabel('Sensor ID', fontsize=12)
-        ax.set_ylabel('Distance to Cleaving Path (µm)', fontsize=12)
-        ax.set_title('Cleaving Path Distances by Sensor', fontsize=14, fontweight='bold')
-
-        ax.legend(loc='best')
-        ax.grid(True, axis='y', linestyle='--', alpha=0.7)
-        ax.set_axisbelow(True)
-        ax.margins(x=0.05)
-
-    plt.tight_layout()
-
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    plt.close(fig)
-
-    return buf.getvalue(), plot_data
-
-
-def generate_leakage_current_plot(db: Optional[Database] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
+    # Create the plot
+    fig = _new_figure((max(10, len(plot_data) * 0.8), 6))
+    ax = fig.subplots()
+
+    x_positions = np.arange(len(plot_data))
+    labels = [d['sensor_id'] for d in plot_data]
+
+    # Plot each series with slight x offset for visibility
+    offset = 0.15
+
+    # Centre
+    centre = _column(plot_data, 'centre')
+    mask = ~np.isnan(centre)
+    if mask.any():
+        ax.scatter(x_positions[mask] - offset, centre[mask],
+                  s=60, marker='o', color='#1f77b4', label='Centre', zorder=3)
+
+    # Edge A
+    edge_a = _column(plot_data, 'edge_a')
+    mask = ~np.isnan(edge_a)
+    if mask.any():
+        ax.scatter(x_positions[mask], edge_a[mask],
+                  s=60, marker='s', color='#2ca02c', label='Edge A', zorder=3)
+
+    # Edge B
+    edge_b = _column(plot_data, 'edge_b')
+    mask = ~np.isnan(edge_b)
+    if mask.any():
+        ax.scatter(x_positions[mask] + offset, edge_b[mask],
+                  s=60, marker='^', color='#d62728', label='Edge B', zorder=3)
+
+    ax.set_xticks(x_positions)
+    ax.set_xticklabels(labels, **_TICK_LABEL_KW)
+    ax.set_xlabel('Sensor ID', **_LABEL_KW)
+    ax.set_ylabel('Distance to Cleaving Path (µm)', **_LABEL_KW)
+    ax.set_title('Cleaving Path Distances by Sensor', **_TITLE_KW)
+
+    ax.legend(loc='best')
+    ax.grid(True, axis='y', **_GRID_KW)
+    ax.set_axisbelow(True)
+    ax.margins(x=0.05)
+
+    fig.tight_layout()
+
+    return _figure_to_png(fig), plot_data
+
+
+@_memoize_plot
+def generate_leakage_current_plot(db: Optional[Database] = None,
+                                  bundle: Optional[DashboardBundle] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
     """
     Generate a scatter plot of leakage current measurements across all sensors.
 
@@ -503,105 +745,82 @@ def generate_leakage_current_plot(db: Optional[Database] = None) -> Tuple[bytes,
     - L.C. @ 100V on wafer
     - L.C. @ 100V cleaved
 
+    Args:
+        db: Database instance (used when no bundle is given)
+        bundle: Preloaded sensor data from load_dashboard_bundle
+
     Returns:
         Tuple of (PNG image bytes, list of sensor data included in plot)
     """
-    if db is None:
-        db = get_default_db()
-
-    # Attribute keys
-    WAFER_KEY = 'L.C. @ 100V on wafer (A/cm2)'
-    CLEAVED_KEY = 'L.C. @ 100V cleaved (A/cm2)'
-
-    # Get all sensors
-    sensors = Component.list_all(component_type='sensor', db=db)
+    if bundle is None:
+        bundle = load_dashboard_bundle(db)
 
     # Collect data for each sensor
     plot_data = []
 
-    for sensor in sensors:
-        wafer = sensor.get_attribute(WAFER_KEY)
-        cleaved = sensor.get_attribute(CLEAVED_KEY)
-
-        # Skip if neither value is present
-        if wafer is None and cleaved is None:
-            continue
-
-        # Convert to float where possible
-        try:
-            wafer = float(wafer) if wafer is not None else None
-        except (ValueError, TypeError):
-            wafer = None
-        try:
-            cleaved = float(cleaved) if cleaved is not None else None
-        except (ValueError, TypeError):
-            cleaved = None
+    for sensor in bundle.sensors:
+        attributes = sensor['attributes']
+        wafer = _float_or_none(attributes.get(WAFER_KEY))
+        cleaved = _float_or_none(attributes.get(CLEAVED_KEY))
 
         if wafer is None and cleaved is None:
             continue
 
         plot_data.append({
-            'sensor_id': sensor.id,
+            'sensor_id': sensor['sensor_id'],
             'wafer': wafer,
             'cleaved': cleaved,
         })
 
-    # Sort by sensor ID for consistent ordering
-    plot_data.sort(key=lambda x: x['sensor_id'])
+    if not plot_data:
+        return _empty_plot_png('No leakage current data available'), plot_data
 
     # Create the plot
-    fig, ax = plt.subplots(figsize=(max(10, len(plot_data) * 0.8), 6))
+    fig = _new_figure((max(10, len(plot_data) * 0.8), 6))
+    ax = fig.subplots()
 
-    if not plot_data:
-        ax.text(0.5, 0.5, 'No leakage current data available',
-                ha='center', va='center', transform=ax.transAxes,
-                fontsize=14, color='gray')
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-    else:
-        x_positions = list(range(len(plot_data)))
-        labels = [d['sensor_id'] for d in plot_data]
+    x_positions = np.arange(len(plot_data))
+    labels = [d['sensor_id'] for d in plot_data]
 
-        # Plot each series with slight x offset for visibility
-        offset = 0.1
+    # Plot each series with slight x offset for visibility
+    offset = 0.1
 
-        # Wafer
-        wafer_vals = [(i, d['wafer']) for i, d in enumerate(plot_data) if d['wafer'] is not None]
-        if wafer_vals:
-            ax.scatter([x - offset for x, _ in wafer_vals], [v for _, v in wafer_vals],
-                      s=60, marker='o', color='#1f77b4', label='On Wafer', zorder=3)
+    # Wafer
+    wafer = _column(plot_data, 'wafer')
+    mask = ~np.isnan(wafer)
+    if mask.any():
+        ax.scatter(x_positions[mask] - offset, wafer[mask],
+                  s=60, marker='o', color='#1f77b4', label='On Wafer', zorder=3)
 
-        # Cleaved
-        cleaved_vals = [(i, d['cleaved']) for i, d in enumerate(plot_data) if d['cleaved'] is not None]
-        if cleaved_vals:
-            ax.scatter([x + offset for x, _ in cleaved_vals], [v for _, v in cleaved_vals],
-                      s=60, marker='s', color='#ff7f0e', label='Cleaved', zorder=3)
+    # Cleaved
+    cleaved = _column(plot_data, 'cleaved')
+    mask = ~np.isnan(cleaved)
+    if mask.any():
+        ax.scatter(x_positions[mask] + offset, cleaved[mask],
+                  s=60, marker='s', color='#ff7f0e', label='Cleaved', zorder=3)
 
-        ax.set_xticks(x_positions)
-        ax.set_xticklabels(labels, rotation=45, ha='right')
-        ax.set_xlabel('Sensor ID', fontsize=12)
-        ax.set_ylabel('Leakage Current @ 100V (A/cm²)', fontsize=12)
-        ax.set_title('Leakage Current by Sensor', fontsize=14, fontweight='bold')
+    ax.set_xticks(x_positions)
+    ax.set_xticklabels(labels, **_TICK_LABEL_KW)
+    ax.set_xlabel('Sensor ID', **_LABEL_KW)
+    ax.set_ylabel('Leakage Current @ 100V (A/cm²)', **_LABEL_KW)
+    ax.set_title('Leakage Current by Sensor', **_TITLE_KW)
 
-        ax.legend(loc='best')
-        ax.grid(True, axis='y', linestyle='--', alpha=0.7)
-        ax.set_axisbelow(True)
-        ax.margins(x=0.05)
+    ax.legend(loc='best')
+    ax.grid(True, axis='y', **_GRID_KW)
+    ax.set_axisbelow(True)
+    ax.margins(x=0.05)
 
-        # Use scientific notation for y-axis if values are small
-        ax.ticklabel_format(axis='y', style='scientific', scilimits=(-3, 3))
+    # Use scientific notation for y-axis if values are small
+    ax.ticklabel_format(axis='y', style='scientific', scilimits=(-3, 3))
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    plt.close(fig)
+    return _figure_to_png(fig), plot_data
 
-    return buf.getvalue(), plot_data
 
-
-def generate_edge_imaging_lcr_plot(db: Optional[Database] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
+@_memoize_plot
+def generate_edge_imaging_lcr_plot(db: Optional[Database] = None,
+                                   bundle: Optional[DashboardBundle] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
     """
     Generate a scatter plot of L, C, R edge gap values across all sensors.
 
@@ -612,38 +831,25 @@ def generate_edge_imaging_lcr_plot(db: Optional[Database] = None) -> Tuple[bytes
 
     Only includes sensors that have all three measurements.
 
+    Args:
+        db: Database instance (used when no bundle is given)
+        bundle: Preloaded sensor data from load_dashboard_bundle
+
     Returns:
         Tuple of (PNG image bytes, list of sensor data included in plot)
     """
-    if db is None:
-        db = get_default_db()
-
-    # Get all sensors
-    sensors = Component.list_all(component_type='sensor', db=db)
+    if bundle is None:
+        bundle = load_dashboard_bundle(db)
 
     # Collect data for each sensor
     plot_data = []
 
-    for sensor in sensors:
-        # Get all test results for this sensor
-        tests = TestResult.get_for_component(sensor.id, db=db)
-
-        # Filter to edge_imaging tests only
-        edge_tests = [t for t in tests if t['test_type'] == 'edge_imaging']
-
-        if not edge_tests:
+    for sensor in bundle.sensors:
+        latest_test = sensor['edge_test']
+        if latest_test is None:
             continue
 
-        # Get the most recent edge imaging test
-        latest_test = edge_tests[0]  # Already sorted by test_date DESC
-
-        # Parse measurements
-        measurements = {}
-        if latest_test['measurements_json']:
-            try:
-                measurements = json.loads(latest_test['measurements_json'])
-            except json.JSONDecodeError:
-                continue
+        measurements = latest_test['measurements']
 
         # Extract L, C, R values
         l_mean = measurements.get('edge_gap_l_mean')
@@ -655,110 +861,91 @@ def generate_edge_imaging_lcr_plot(db: Optional[Database] = None) -> Tuple[bytes
             continue
 
         plot_data.append({
-            'sensor_id': sensor.id,
+            'sensor_id': sensor['sensor_id'],
             'l_mean': l_mean,
             'c_mean': c_mean,
             'r_mean': r_mean,
             'test_date': latest_test['test_date'],
         })
 
-    # Sort by sensor ID for consistent ordering
-    plot_data.sort(key=lambda x: x['sensor_id'])
-
-    # Create the plot
-    fig, ax = plt.subplots(figsize=(max(10, len(plot_data) * 0.8), 6))
-
     if not plot_data:
-        ax.text(0.5, 0.5, 'No edge imaging L/C/R data available',
-                ha='center', va='center', transform=ax.transAxes,
-                fontsize=14, color='gray')
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-    else:
-        x_positions = list(range(len(plot_data)))
-        labels = [d['sensor_id'] for d in plot_data]
-
-        # Plot each series with slight x offset for visibility
-        offset = 0.2
-
-        # L (Left)
-        l_vals = [(i, d['l_mean']) for i, d in enumerate(plot_data) if d['l_mean'] is not None]
-        if l_vals:
-            ax.scatter([x - offset for x, _ in l_vals], [v for _, v in l_vals],
-                      s=80, marker='<', color='#2ca02c', label='L (Left)', zorder=3)
-
-        # C (Center)
-        c_vals = [(i, d['c_mean']) for i, d in enumerate(plot_data) if d['c_mean'] is not None]
-        if c_vals:
-            ax.scatter([x for x, _ in c_vals], [v for _, v in c_vals],
-                      s=80, marker='o', color='#1f77b4', label='C (Center)', zorder=3)
-
-        # R (Right)
-        r_vals = [(i, d['r_mean']) for i, d in enumerate(plot_data) if d['r_mean'] is not None]
-        if r_vals:
-            ax.scatter([x + offset for x, _ in r_vals], [v for _, v in r_vals],
-                      s=80, marker='>', color='#d62728', label='R (Right)', zorder=3)
-
-        ax.set_xticks(x_positions)
-        ax.set_xticklabels(labels, rotation=45, ha='right')
-        ax.set_xlabel('Sensor ID', fontsize=12)
-        ax.set_ylabel('Edge Gap (µm)', fontsize=12)
-        ax.set_title('Edge Gap by Position (L/C/R)', fontsize=14, fontweight='bold')
-
-        ax.legend(loc='best')
-        ax.grid(True, axis='y', linestyle='--', alpha=0.7)
-        ax.set_axisbelow(True)
-        ax.margins(x=0.05)
-
-    plt.tight_layout()
+        return _empty_plot_png('No edge imaging L/C/R data available'), plot_data
 
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    plt.close(fig)
-
-    return buf.getvalue(), plot_data
-
-
-def generate_edge_slope_plot(db: Optional[Database] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
+    # Create the plot
+    fig = _new_figure((max(10, len(plot_data) * 0.8), 6))
+    ax = fig.subplots()
+
+    x_positions = np.arange(len(plot_data))
+    labels = [d['sensor_id'] for d in plot_data]
+
+    # Plot each series with slight x offset for visibility
+    offset = 0.2
+
+    # L (Left)
+    l_mean = _column(plot_data, 'l_mean')
+    mask = ~np.isnan(l_mean)
+    if mask.any():
+        ax.scatter(x_positions[mask] - offset, l_mean[mask],
+                  s=80, marker='<', color='#2ca02c', label='L (Left)', zorder=3)
+
+    # C (Center)
+    c_mean = _column(plot_data, 'c_mean')
+    mask = ~np.isnan(c_mean)
+    if mask.any():
+        ax.scatter(x_positions[mask], c_mean[mask],
+                  s=80, marker='o', color='#1f77b4', label='C (Center)', zorder=3)
+
+    # R (Right)
+    r_mean = _column(plot_data, 'r_mean')
+    mask = ~np.isnan(r_mean)
+    if mask.any():
+        ax.scatter(x_positions[mask] + offset, r_mean[mask],
+                  s=80, marker='>', color='#d62728', label='R (Right)', zorder=3)
+
+    ax.set_xticks(x_positions)
+    ax.set_xticklabels(labels, **_TICK_LABEL_KW)
+    ax.set_xlabel('Sensor ID', **_LABEL_KW)
+    ax.set_ylabel('Edge Gap (µm)', **_LABEL_KW)
+    ax.set_title('Edge Gap by Position (L/C/R)', **_TITLE_KW)
+
+    ax.legend(loc='best')
+    ax.grid(True, axis='y', **_GRID_KW)
+    ax.set_axisbelow(True)
+    ax.margins(x=0.05)
+
+    fig.tight_layout()
+
+    return _figure_to_png(fig), plot_data
+
+
+@_memoize_plot
+def generate_edge_slope_plot(db: Optional[Database] = None,
+                             bundle: Optional[DashboardBundle] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
     """
     Generate a scatter plot of edge slope values across all sensors.
 
     Plots the edge slope in µm/mm for each sensor that has L, C, R measurements.
     Color-coded by R² fit quality.
 
+    Args:
+        db: Database instance (used when no bundle is given)
+        bundle: Preloaded sensor data from load_dashboard_bundle
+
     Returns:
         Tuple of (PNG image bytes, list of sensor data included in plot)
     """
-    if db is None:
-        db = get_default_db()
-
-    # Get all sensors
-    sensors = Component.list_all(component_type='sensor', db=db)
+    if bundle is None:
+        bundle = load_dashboard_bundle(db)
 
     # Collect data for each sensor
     plot_data = []
 
-    for sensor in sensors:
-        # Get all test results for this sensor
-        tests = TestResult.get_for_component(sensor.id, db=db)
-
-        # Filter to edge_imaging tests only
-        edge_tests = [t for t in tests if t['test_type'] == 'edge_imaging']
-
-        if not edge_tests:
+    for sensor in bundle.sensors:
+        latest_test = sensor['edge_test']
+        if latest_test is None:
             continue
 
-        # Get the most recent edge imaging test
-        latest_test = edge_tests[0]  # Already sorted by test_date DESC
-
-        # Parse measurements
-        measurements = {}
-        if latest_test['measurements_json']:
-            try:
-                measurements = json.loads(latest_test['measurements_json'])
-            except json.JSONDecodeError:
-                continue
+        measurements = latest_test['measurements']
 
         # Extract slope values
         slope = measurements.get('edge_slope_um_per_mm')
@@ -770,76 +957,67 @@ def generate_edge_slope_plot(db: Optional[Database] = None) -> Tuple[bytes, List
             continue
 
         plot_data.append({
-            'sensor_id': sensor.id,
+            'sensor_id': sensor['sensor_id'],
             'slope': slope,
             'r_squared': r_squared if r_squared is not None else 0,
             'angle_deg': angle_deg,
             'test_date': latest_test['test_date'],
         })
 
-    # Sort by sensor ID for consistent ordering
-    plot_data.sort(key=lambda x: x['sensor_id'])
+    if not plot_data:
+        return _empty_plot_png('No edge slope data available'), plot_data
 
     # Create the plot
-    fig, ax = plt.subplots(figsize=(max(10, len(plot_data) * 0.8), 6))
+    fig = _new_figure((max(10, len(plot_data) * 0.8), 6))
+    ax = fig.subplots()
+
+    x_positions = list(range(len(plot_data)))
+    labels = [d['sensor_id'] for d in plot_data]
+    slopes = [d['slope'] for d in plot_data]
+    r_squared_vals = [d['r_squared'] for d in plot_data]
+
+    # Color bars by R² value
+    colors = []
+    for r2 in r_squared_vals:
+        if r2 >= 0.9:
+            colors.append('#2ca02c')  # Green for good fit
+        elif r2 >= 0.7:
+            colors.append('#ff7f0e')  # Orange for moderate fit
+        else:
+            colors.append('#d62728')  # Red for poor fit
 
-    if not plot_data:
-        ax.text(0.5, 0.5, 'No edge slope data available',
-                ha='center', va='center', transform=ax.transAxes,
-                fontsize=14, color='gray')
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-    else:
-        x_positions = list(range(len(plot_data)))
-        labels = [d['sensor_id'] for d in plot_data]
-        slopes = [d['slope'] for d in plot_data]
-        r_squared_vals = [d['r_squared'] for d in plot_data]
-
-        # Color bars by R² value
-        colors = []
-        for r2 in r_squared_vals:
-            if r2 >= 0.9:
-                colors.append('#2ca02c')  # Green for good fit
-            elif r2 >= 0.7:
-                colors.append('#ff7f0e')  # Orange for moderate fit
-            else:
-                colors.append('#d62728')  # Red for poor fit
-
-        ax.scatter(x_positions, slopes, c=colors, s=80, edgecolor='black', linewidth=0.5, zorder=3)
-
-        # Add a horizontal line at y=0 for reference
-        ax.axhline(y=0, color='gray', linestyle='-', linewidth=0.5)
-
-        ax.set_xticks(x_positions)
-        ax.set_xticklabels(labels, rotation=45, ha='right')
-        ax.set_xlabel('Sensor ID', fontsize=12)
-        ax.set_ylabel('Edge Slope (µm/mm)', fontsize=12)
-        ax.set_title('Edge Slope by Sensor', fontsize=14, fontweight='bold')
-
-        # Add legend for R² colors
-        from matplotlib.patches import Patch
-        legend_elements = [
-            Patch(facecolor='#2ca02c', edgecolor='black', label='R² ≥ 0.9 (good fit)'),
-            Patch(facecolor='#ff7f0e', edgecolor='black', label='R² ≥ 0.7 (moderate)'),
-            Patch(facecolor='#d62728', edgecolor='black', label='R² < 0.7 (poor fit)'),
-        ]
-        ax.legend(handles=legend_elements, loc='best')
-
-        ax.grid(True, axis='y', linestyle='--', alpha=0.7)
-        ax.set_axisbelow(True)
-        ax.margins(x=0.05)
-
-    plt.tight_layout()
-
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    plt.close(fig)
-
-    return buf.getvalue(), plot_data
-
-
-def generate_edge_correlation_plots(db: Optional[Database] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
+    ax.scatter(x_positions, slopes, c=colors, s=80, zorder=3, **_OUTLINE_KW)
+
+    # Add a horizontal line at y=0 for reference
+    ax.axhline(y=0, color='gray', linestyle='-', linewidth=0.5)
+
+    ax.set_xticks(x_positions)
+    ax.set_xticklabels(labels, **_TICK_LABEL_KW)
+    ax.set_xlabel('Sensor ID', **_LABEL_KW)
+    ax.set_ylabel('Edge Slope (µm/mm)', **_LABEL_KW)
+    ax.set_title('Edge Slope by Sensor', **_TITLE_KW)
+
+    # Add legend for R² colors
+    Patch = _mpl().Patch
+    legend_elements = [
+        Patch(facecolor='#2ca02c', edgecolor='black', label='R² ≥ 0.9 (good fit)'),
+        Patch(facecolor='#ff7f0e', edgecolor='black', label='R² ≥ 0.7 (moderate)'),
+        Patch(facecolor='#d62728', edgecolor='black', label='R² < 0.7 (poor fit)'),
+    ]
+    ax.legend(handles=legend_elements, loc='best')
+
+    ax.grid(True, axis='y', **_GRID_KW)
+    ax.set_axisbelow(True)
+    ax.margins(x=0.05)
+
+    fig.tight_layout()
+
+    return _figure_to_png(fig), plot_data
+
+
+@_memoize_plot
+def generate_edge_correlation_plots(db: Optional[Database] = None,
+                                    bundle: Optional[DashboardBundle] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
     """
     Generate correlation plots between edge imaging measurements (L, C, R) and CNM edge attributes.
 
@@ -848,60 +1026,31 @@ def generate_edge_correlation_plots(db: Optional[Database] = None) -> Tuple[byte
     - Right (R) edge gap vs CNM Edge B distance
     - Center (C) edge gap vs CNM Centre distance
 
+    Args:
+        db: Database instance (used when no bundle is given)
+        bundle: Preloaded sensor data from load_dashboard_bundle
+
     Returns:
         Tuple of (PNG image bytes, list of sensor data included in plot)
     """
-    if db is None:
-        db = get_default_db()
-
-    # CNM attribute keys
-    CENTRE_KEY = 'Centre distance to the cleaving path (µm)'
-    EDGE_A_KEY = 'EDGE A distance to the cleaving path (µm)'
-    EDGE_B_KEY = 'EDGE B distance to the cleaving path (µm)'
-
-    # Get all sensors
-    sensors = Component.list_all(component_type='sensor', db=db)
+    if bundle is None:
+        bundle = load_dashboard_bundle(db)
 
     # Collect data for each sensor
     plot_data = []
 
-    for sensor in sensors:
-        # Get CNM edge attributes
-        centre_cnm = sensor.get_attribute(CENTRE_KEY)
-        edge_a_cnm = sensor.get_attribute(EDGE_A_KEY)
-        edge_b_cnm = sensor.get_attribute(EDGE_B_KEY)
-
-        # Convert to float where possible
-        try:
-            centre_cnm = float(centre_cnm) if centre_cnm is not None else None
-        except (ValueError, TypeError):
-            centre_cnm = None
-        try:
-            edge_a_cnm = float(edge_a_cnm) if edge_a_cnm is not None else None
-        except (ValueError, TypeError):
-            edge_a_cnm = None
-        try:
-            edge_b_cnm = float(edge_b_cnm) if edge_b_cnm is not None else None
-        except (ValueError, TypeError):
-            edge_b_cnm = None
-
-        # Get edge imaging test results
-        tests = TestResult.get_for_component(sensor.id, db=db)
-        edge_tests = [t for t in tests if t['test_type'] == 'edge_imaging']
-
-        if not edge_tests:
+    for sensor in bundle.sensors:
+        latest_test = sensor['edge_test']
+        if latest_test is None:
             continue
 
-        # Get the most recent edge imaging test
-        latest_test = edge_tests[0]
+        # Get CNM edge attributes
+        attributes = sensor['attributes']
+        centre_cnm = _float_or_none(attributes.get(CENTRE_KEY))
+        edge_a_cnm = _float_or_none(attributes.get(EDGE_A_KEY))
+        edge_b_cnm = _float_or_none(attributes.get(EDGE_B_KEY))
 
-        # Parse measurements
-        measurements = {}
-        if latest_test['measurements_json']:
-            try:
-                measurements = json.loads(latest_test['measurements_json'])
-            except json.JSONDecodeError:
-                continue
+        measurements = latest_test['measurements']
 
         # Extract L, C, R edge gap values
         l_mean = measurements.get('edge_gap_l_mean')
@@ -921,7 +1070,7 @@ def generate_edge_correlation_plots(db: Optional[Database] = None) -> Tuple[byte
             continue
 
         plot_data.append({
-            'sensor_id': sensor.id,
+            'sensor_id': sensor['sensor_id'],
             'l_mean': l_mean,
             'c_mean': c_mean,
             'r_mean': r_mean,
@@ -930,230 +1079,200 @@ def generate_edge_correlation_plots(db: Optional[Database] = None) -> Tuple[byte
             'edge_b_cnm': edge_b_cnm,
         })
 
+    if not plot_data:
+        return _empty_plot_png('No edge correlation data available'), plot_data
+
+    # Build one array per column; missing values become NaN
+    sensor_ids = [d['sensor_id'] for d in plot_data]
+    l_mean = _column(plot_data, 'l_mean')
+    c_mean = _column(plot_data, 'c_mean')
+    r_mean = _column(plot_data, 'r_mean')
+    edge_a_cnm = _column(plot_data, 'edge_a_cnm')
+    centre_cnm = _column(plot_data, 'centre_cnm')
+    edge_b_cnm = _column(plot_data, 'edge_b_cnm')
+
     # Create a 1x3 subplot figure
-    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
+    fig = _new_figure((15, 5))
+    axes = fig.subplots(1, 3)
+
+    def calc_fit(x_vals, y_vals):
+        """
+        Calculate Pearson correlation and least-squares line from the same sums.
 
-    def calc_correlation(x_vals, y_vals):
-        """Calculate Pearson correlation coefficient."""
+        Returns (correlation, slope, intercept); entries are None when
+        they cannot be computed.
+        """
         if len(x_vals) < 2:
-            return None
+            return None, None, None
         n = len(x_vals)
-        sum_x = sum(x_vals)
-        sum_y = sum(y_vals)
-        sum_xy = sum(x * y for x, y in zip(x_vals, y_vals))
-        sum_x2 = sum(x * x for x in x_vals)
-        sum_y2 = sum(y * y for y in y_vals)
-
-        numerator = n * sum_xy - sum_x * sum_y
-        denominator = ((n * sum_x2 - sum_x ** 2) * (n * sum_y2 - sum_y ** 2)) ** 0.5
-
-        if denominator == 0:
-            return None
-        return numerator / denominator
+        sum_x = float(x_vals.sum())
+        sum_y = float(y_vals.sum())
+        sum_xy = float(np.dot(x_vals, y_vals))
+        sum_x2 = float(np.dot(x_vals, x_vals))
+        sum_y2 = float(np.dot(y_vals, y_vals))
+
+        cov_xy = n * sum_xy - sum_x * sum_y
+        var_x = n * sum_x2 - sum_x ** 2
+        var_y = n * sum_y2 - sum_y ** 2
+
+        corr = cov_xy / (var_x * var_y) ** 0.5 if var_x * var_y > 0 else None
+        if var_x == 0:
+            return corr, None, None
+        slope = cov_xy / var_x
+        intercept = (sum_y - slope * sum_x) / n
+        return corr, slope, intercept
 
     # Plot 1: Left (L) vs Edge A
     ax1 = axes[0]
-    l_pairs = [(d['l_mean'], d['edge_a_cnm'], d['sensor_id'])
-               for d in plot_data
-               if d['l_mean'] is not None and d['edge_a_cnm'] is not None]
+    l_mask = ~np.isnan(edge_a_cnm) & ~np.isnan(l_mean)
 
-    if l_pairs:
-        x_vals = [p[1] for p in l_pairs]  # Edge A (CNM)
-        y_vals = [p[0] for p in l_pairs]  # L mean (edge imaging)
-        labels = [p[2] for p in l_pairs]
+    if l_mask.any():
+        x_vals = edge_a_cnm[l_mask]  # Edge A (CNM)
+        y_vals = l_mean[l_mask]  # L mean (edge imaging)
+        labels = [sensor_ids[i] for i in np.flatnonzero(l_mask)]
 
-        ax1.scatter(x_vals, y_vals, s=80, marker='<', color='#2ca02c', edgecolor='black', linewidth=0.5)
+        ax1.scatter(x_vals, y_vals, s=80, marker='<', color='#2ca02c', **_OUTLINE_KW)
 
         # Add sensor labels
         for x, y, label in zip(x_vals, y_vals, labels):
-            ax1.annotate(label, (x, y), fontsize=7, ha='left', va='bottom',
-                        xytext=(3, 3), textcoords='offset points')
+            ax1.annotate(label, (x, y), **_POINT_LABEL_KW)
 
         # Calculate and display correlation and fit
-        corr = calc_correlation(x_vals, y_vals)
+        corr, slope, intercept = calc_fit(x_vals, y_vals)
         fit_text_parts = []
         if corr is not None:
             fit_text_parts.append(f'r = {corr:.3f}')
 
-        # Add trend line
-        if len(x_vals) >= 2 and max(x_vals) != min(x_vals):
-            try:
-                import numpy as np
-                z = np.polyfit(x_vals, y_vals, 1)
-                slope, intercept = z[0], z[1]
-                p = np.poly1d(z)
-                x_line = np.linspace(min(x_vals), max(x_vals), 100)
-                ax1.plot(x_line, p(x_line), 'k--', alpha=0.5, linewidth=1)
-                fit_text_parts.append(f'slope = {slope:.2f}')
-                fit_text_parts.append(f'intercept = {intercept:.1f} µm')
-            except Exception:
-                pass  # Skip trend line if fitting fails
+        # Add trend line (a straight line only needs its two end points)
+        if slope is not None:
+            x_line = np.array([x_vals.min(), x_vals.max()])
+            ax1.plot(x_line, slope * x_line + intercept, 'k--', alpha=0.5, linewidth=1)
+            fit_text_parts.append(f'slope = {slope:.2f}')
+            fit_text_parts.append(f'intercept = {intercept:.1f} µm')
 
         if fit_text_parts:
-            ax1.text(0.05, 0.95, '\n'.join(fit_text_parts), transform=ax1.transAxes,
-                    fontsize=9, verticalalignment='top',
-                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+            ax1.text(0.05, 0.95, '\n'.join(fit_text_parts), transform=ax1.transAxes, **_FIT_TEXT_KW)
 
-    ax1.set_xlabel('CNM Edge A Distance (µm)', fontsize=10)
-    ax1.set_ylabel('Edge Imaging L Mean (µm)', fontsize=10)
-    ax1.set_title('Left Edge (L) vs CNM Edge A', fontsize=12, fontweight='bold')
-    ax1.grid(True, linestyle='--', alpha=0.7)
+    ax1.set_xlabel('CNM Edge A Distance (µm)', **_SUBPLOT_LABEL_KW)
+    ax1.set_ylabel('Edge Imaging L Mean (µm)', **_SUBPLOT_LABEL_KW)
+    ax1.set_title('Left Edge (L) vs CNM Edge A', **_SUBPLOT_TITLE_KW)
+    ax1.grid(True, **_GRID_KW)
 
     # Plot 2: Center (C) vs Centre
     ax2 = axes[1]
-    c_pairs = [(d['c_mean'], d['centre_cnm'], d['sensor_id'])
-               for d in plot_data
-               if d['c_mean'] is not None and d['centre_cnm'] is not None]
+    c_mask = ~np.isnan(centre_cnm) & ~np.isnan(c_mean)
 
-    if c_pairs:
-        x_vals = [p[1] for p in c_pairs]  # Centre (CNM)
-        y_vals = [p[0] for p in c_pairs]  # C mean (edge imaging)
-        labels = [p[2] for p in c_pairs]
+    if c_mask.any():
+        x_vals = centre_cnm[c_mask]  # Centre (CNM)
+        y_vals = c_mean[c_mask]  # C mean (edge imaging)
+        labels = [sensor_ids[i] for i in np.flatnonzero(c_mask)]
 
-        ax2.scatter(x_vals, y_vals, s=80, marker='o', color='#1f77b4', edgecolor='black', linewidth=0.5)
+        ax2.scatter(x_vals, y_vals, s=80, marker='o', color='#1f77b4', **_OUTLINE_KW)
 
         # Add sensor labels
         for x, y, label in zip(x_vals, y_vals, labels):
-            ax2.annotate(label, (x, y), fontsize=7, ha='left', va='bottom',
-                        xytext=(3, 3), textcoords='offset points')
+            ax2.annotate(label, (x, y), **_POINT_LABEL_KW)
 
         # Calculate and display correlation and fit
-        corr = calc_correlation(x_vals, y_vals)
+        corr, slope, intercept = calc_fit(x_vals, y_vals)
         fit_text_parts = []
         if corr is not None:
             fit_text_parts.append(f'r = {corr:.3f}')
 
-        # Add trend line
-        if len(x_vals) >= 2 and max(x_vals) != min(x_vals):
-            try:
-                import numpy as np
-                z = np.polyfit(x_vals, y_vals, 1)
-                slope, intercept = z[0], z[1]
-                p = np.poly1d(z)
-                x_line = np.linspace(min(x_vals), max(x_vals), 100)
-                ax2.plot(x_line, p(x_line), 'k--', alpha=0.5, linewidth=1)
-                fit_text_parts.append(f'slope = {slope:.2f}')
-                fit_text_parts.append(f'intercept = {intercept:.1f} µm')
-            except Exception:
-                pass  # Skip trend line if fitting fails
+        # Add trend line (a straight line only needs its two end points)
+        if slope is not None:
+            x_line = np.array([x_vals.min(), x_vals.max()])
+            ax2.plot(x_line, slope * x_line + intercept, 'k--', alpha=0.5, linewidth=1)
+            fit_text_parts.append(f'slope = {slope:.2f}')
+            fit_text_parts.append(f'intercept = {intercept:.1f} µm')
 
         if fit_text_parts:
-            ax2.text(0.05, 0.95, '\n'.join(fit_text_parts), transform=ax2.transAxes,
-                    fontsize=9, verticalalignment='top',
-                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+            ax2.text(0.05, 0.95, '\n'.join(fit_text_parts), transform=ax2.transAxes, **_FIT_TEXT_KW)
 
-    ax2.set_xlabel('CNM Centre Distance (µm)', fontsize=10)
-    ax2.set_ylabel('Edge Imaging C Mean (µm)', fontsize=10)
-    ax2.set_title('Center (C) vs CNM Centre', fontsize=12, fontweight='bold')
-    ax2.grid(True, linestyle='--', alpha=0.7)
+    ax2.set_xlabel('CNM Centre Distance (µm)', **_SUBPLOT_LABEL_KW)
+    ax2.set_ylabel('Edge Imaging C Mean (µm)', **_SUBPLOT_LABEL_KW)
+    ax2.set_title('Center (C) vs CNM Centre', **_SUBPLOT_TITLE_KW)
+    ax2.grid(True, **_GRID_KW)
 
     # Plot 3: Right (R) vs Edge B
     ax3 = axes[2]
-    r_pairs = [(d['r_mean'], d['edge_b_cnm'], d['sensor_id'])
-               for d in plot_data
-               if d['r_mean'] is not None and d['edge_b_cnm'] is not None]
+    r_mask = ~np.isnan(edge_b_cnm) & ~np.isnan(r_mean)
 
-    if r_pairs:
-        x_vals = [p[1] for p in r_pairs]  # Edge B (CNM)
-        y_vals = [p[0] for p in r_pairs]  # R mean (edge imaging)
-        labels = [p[2] for p in r_pairs]
+    if r_mask.any():
+        x_vals = edge_b_cnm[r_mask]  # Edge B (CNM)
+        y_vals = r_mean[r_mask]  # R mean (edge imaging)
+        labels = [sensor_ids[i] for i in np.flatnonzero(r_mask)]
 
-        ax3.scatter(x_vals, y_vals, s=80, marker='>', color='#d62728', edgecolor='black', linewidth=0.5)
+        ax3.scatter(x_vals, y_vals, s=80, marker='>', color='#d62728', **_OUTLINE_KW)
 
         # Add sensor labels
         for x, y, label in zip(x_vals, y_vals, labels):
-            ax3.annotate(label, (x, y), fontsize=7, ha='left', va='bottom',
-                        xytext=(3, 3), textcoords='offset points')
+            ax3.annotate(label, (x, y), **_POINT_LABEL_KW)
 
         # Calculate and display correlation and fit
-        corr = calc_correlation(x_vals, y_vals)
+        corr, slope, intercept = calc_fit(x_vals, y_vals)
         fit_text_parts = []
         if corr is not None:
             fit_text_parts.append(f'r = {corr:.3f}')
 
-        # Add trend line
-        if len(x_vals) >= 2 and max(x_vals) != min(x_vals):
-            try:
-                import numpy as np
-                z = np.polyfit(x_vals, y_vals, 1)
-                slope, intercept = z[0], z[1]
-                p = np.poly1d(z)
-                x_line = np.linspace(min(x_vals), max(x_vals), 100)
-                ax3.plot(x_line, p(x_line), 'k--', alpha=0.5, linewidth=1)
-                fit_text_parts.append(f'slope = {slope:.2f}')
-                fit_text_parts.append(f'intercept = {intercept:.1f} µm')
-            except Exception:
-                pass  # Skip trend line if fitting fails
+        # Add trend line (a straight line only needs its two end points)
+        if slope is not None:
+            x_line = np.array([x_vals.min(), x_vals.max()])
+            ax3.plot(x_line, slope * x_line + intercept, 'k--', alpha=0.5, linewidth=1)
+            fit_text_parts.append(f'slope = {slope:.2f}')
+            fit_text_parts.append(f'intercept = {intercept:.1f} µm')
 
         if fit_text_parts:
-            ax3.text(0.05, 0.95, '\n'.join(fit_text_parts), transform=ax3.transAxes,
-                    fontsize=9, verticalalignment='top',
-                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+            ax3.text(0.05, 0.95, '\n'.join(fit_text_parts), transform=ax3.transAxes, **_FIT_TEXT_KW)
 
-    ax3.set_xlabel('CNM Edge B Distance (µm)', fontsize=10)
-    ax3.set_ylabel('Edge Imaging R Mean (µm)', fontsize=10)
-    ax3.set_title('Right Edge (R) vs CNM Edge B', fontsize=12, fontweight='bold')
-    ax3.grid(True, linestyle='--', alpha=0.7)
+    ax3.set_xlabel('CNM Edge B Distance (µm)', **_SUBPLOT_LABEL_KW)
+    ax3.set_ylabel('Edge Imaging R Mean (µm)', **_SUBPLOT_LABEL_KW)
+    ax3.set_title('Right Edge (R) vs CNM Edge B', **_SUBPLOT_TITLE_KW)
+    ax3.grid(True, **_GRID_KW)
 
     # Handle empty plots
-    for ax, pairs, name in [(ax1, l_pairs, 'Left/Edge A'),
-                            (ax2, c_pairs, 'Center/Centre'),
-                            (ax3, r_pairs, 'Right/Edge B')]:
-        if not pairs:
+    for ax, mask, name in [(ax1, l_mask, 'Left/Edge A'),
+                           (ax2, c_mask, 'Center/Centre'),
+                           (ax3, r_mask, 'Right/Edge B')]:
+        if not mask.any():
             ax.text(0.5, 0.5, f'No {name} data available',
                    ha='center', va='center', transform=ax.transAxes,
                    fontsize=12, color='gray')
 
-    plt.suptitle('Edge Distance Correlations: Edge Imaging vs CNM Measurements',
-                 fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
+    fig.suptitle('Edge Distance Correlations: Edge Imaging vs CNM Measurements',
+                 **_TITLE_KW)
+    fig.tight_layout()
 
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    plt.close(fig)
+    return _figure_to_png(fig), plot_data
 
-    return buf.getvalue(), plot_data
 
-
-def generate_edge_imaging_minmax(db: Optional[Database] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
+@_memoize_plot
+def generate_edge_imaging_minmax(db: Optional[Database] = None,
+                                 bundle: Optional[DashboardBundle] = None) -> Tuple[bytes, List[Dict[str, Any]]]:
     """
     Generate a scatter plot of edge imaging min/max values across all sensors.
 
+    Args:
+        db: Database instance (used when no bundle is given)
+        bundle: Preloaded sensor data from load_dashboard_bundle
+
     Returns:
         Tuple of (PNG image bytes, list of sensor data included in plot)
 
     Plots min and max values as separate scatter series for each sensor.
     """
-    if db is None:
-        db = get_default_db()
-
-    # Get all sensors
-    sensors = Component.list_all(component_type='sensor', db=db)
+    if bundle is None:
+        bundle = load_dashboard_bundle(db)
 
     # Collect data for each sensor
     plot_data = []
 
-    for sensor in sensors:
-        # Get all test results for this sensor
-        tests = TestResult.get_for_component(sensor.id, db=db)
-
-        # Filter to edge_imaging tests only
-        edge_tests = [t for t in tests if t['test_type'] == 'edge_imaging']
-
-        if not edge_tests:
+    for sensor in bundle.sensors:
+        latest_test = sensor['edge_test']
+        if latest_test is None:
             continue
 
-        # Get the most recent edge imaging test
-        latest_test = edge_tests[0]  # Already sorted by test_date DESC
-
-        # Parse measurements
-        measurements = {}
-        if latest_test['measurements_json']:
-            try:
-                measurements = json.loads(latest_test['measurements_json'])
-            except json.JSONDecodeError:
-                continue
+        measurements = latest_test['measurements']
 
         # Extract edge gap values
         edge_gap_min = measurements.get('edge_gap_min')
@@ -1164,58 +1283,85 @@ def generate_edge_imaging_minmax(db: Optional[Database] = None) -> Tuple[bytes,
             continue
 
         plot_data.append({
-            'sensor_id': sensor.id,
+            'sensor_id': sensor['sensor_id'],
             'min': edge_gap_min,
             'max': edge_gap_max,
             'test_date': latest_test['test_date'],
         })
 
-    # Sort by sensor ID for consistent ordering
-    plot_data.sort(key=lambda x: x['sensor_id'])
+    if not plot_data:
+        return _empty_plot_png('No edge imaging test data available'), plot_data
 
     # Create the plot
-    fig, ax = plt.subplots(figsize=(max(10, len(plot_data) * 0.8), 6))
+    fig = _new_figure((max(10, len(plot_data) * 0.8), 6))
+    ax = fig.subplots()
 
-    if not plot_data:
-        ax.text(0.5, 0.5, 'No edge imaging test data available',
-                ha='center', va='center', transform=ax.transAxes,
-                fontsize=14, color='gray')
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-    else:
-        # Prepare data for plotting
-        x_positions = range(len(plot_data))
-        labels = [d['sensor_id'] for d in plot_data]
-        mins = [d['min'] for d in plot_data]
-        maxs = [d['max'] for d in plot_data]
-
-        # Plot min and max as separate series
-        ax.scatter(x_positions, mins, s=60, marker='v', color='#2ca02c', label='Min', zorder=3)
-        ax.scatter(x_positions, maxs, s=60, marker='^', color='#d62728', label='Max', zorder=3)
-
-        # Customize axes
-        ax.set_xticks(x_positions)
-        ax.set_xticklabels(labels, rotation=45, ha='right')
-        ax.set_xlabel('Sensor ID', fontsize=12)
-        ax.set_ylabel('Edge Gap (um)', fontsize=12)
-        ax.set_title('Edge Imaging Min/Max Values by Sensor', fontsize=14, fontweight='bold')
-
-        # Add legend
-        ax.legend(loc='best')
-
-        # Add grid for readability
-        ax.grid(True, axis='y', linestyle='--', alpha=0.7)
-        ax.set_axisbelow(True)
-
-        # Add some padding
-        ax.margins(x=0.05)
-
-    plt.tight_layout()
-
-    # Save to bytes
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    plt.close(fig)
-
-    return buf.getvalue(), plot_data
+    # Prepare data for plotting
+    x_positions = np.arange(len(plot_data))
+    labels = [d['sensor_id'] for d in plot_data]
+    mins = _column(plot_data, 'min')
+    maxs = _column(plot_data, 'max')
+
+    # Plot min and max as separate series
+    ax.scatter(x_positions, mins, s=60, marker='v', color='#2ca02c', label='Min', zorder=3)
+    ax.scatter(x_positions, maxs, s=60, marker='^', color='#d62728', label='Max', zorder=3)
+
+    # Customize axes
+    ax.set_xticks(x_positions)
+    ax.set_xticklabels(labels, **_TICK_LABEL_KW)
+    ax.set_xlabel('Sensor ID', **_LABEL_KW)
+    ax.set_ylabel('Edge Gap (um)', **_LABEL_KW)
+    ax.set_title('Edge Imaging Min/Max Values by Sensor', **_TITLE_KW)
+
+    # Add legend
+    ax.legend(loc='best')
+
+    # Add grid for readability
+    ax.grid(True, axis='y', **_GRID_KW)
+    ax.set_axisbelow(True)
+
+    # Add some padding
+    ax.margins(x=0.05)
+
+    fig.tight_layout()
+
+    return _figure_to_png(fig), plot_data
+
+
+# Summary plots shown together on the sensor summary page
+SUMMARY_PLOTS = {
+    'edge_imaging_summary': generate_edge_imaging_summary,
+    'edge_imaging_minmax': generate_edge_imaging_minmax,
+    'edge_imaging_lcr': generate_edge_imaging_lcr_plot,
+    'edge_slope': generate_edge_slope_plot,
+    'edge_correlation': generate_edge_correlation_plots,
+    'cleaving_distance': generate_cleaving_distance_plot,
+    'leakage_current': generate_leakage_current_plot,
+}
+
+_render_pool = ThreadPoolExecutor(max_workers=len(SUMMARY_PLOTS),
+                                  thread_name_prefix='svt-plot')
+
+
+def render_summary_plots(db: Optional[Database] = None,
+                         bundle: Optional[DashboardBundle] = None) -> Dict[str, Tuple[bytes, List[Dict[str, Any]]]]:
+    """
+    Render all summary plots concurrently from one shared bundle.
+
+    The generators are independent and each draws on its own figure, so
+    they run on a small thread pool. Results land in each generator's
+    cache, letting the individual image routes answer without re-rendering.
+
+    Args:
+        db: Database instance (used when no bundle is given)
+        bundle: Preloaded sensor data from load_dashboard_bundle
+
+    Returns:
+        Dict mapping plot name (see SUMMARY_PLOTS) to (PNG bytes, plot_data)
+    """
+    if bundle is None:
+        bundle = load_dashboard_bundle(db)
+
+    futures = {name: _render_pool.submit(generator, bundle=bundle)
+               for name, generator in SUMMARY_PLOTS.items()}
+    return {name: future.result() for name, future in futures.items()}
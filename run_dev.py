@@ -5,15 +5,20 @@ Development server launcher for HPS SVT Tracker web interface
 Usage:
     python run_dev.py
 """
-import sys
+import importlib.util
 import os
 
-# Add current directory to path to allow importing web module
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Select the non-interactive backend up front so neither the server nor the
+# reloader's child process probes for GUI backends
+os.environ.setdefault('MPLBACKEND', 'Agg')
 
 from web.app import create_app
 from web.config import DevelopmentConfig
 
+# The watchdog reloader reacts to file system events instead of polling
+# every module's mtime; fall back to polling when it is not installed
+RELOADER_TYPE = 'watchdog' if importlib.util.find_spec('watchdog') else 'stat'
+
 
 if __name__ == '__main__':
     print("=" * 60)
@@ -28,4 +33,4 @@ if __name__ == '__main__':
     print()
 
     app = create_app(DevelopmentConfig)
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=True, reloader_type=RELOADER_TYPE)
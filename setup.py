@@ -23,6 +23,7 @@ setup(
             "Flask>=2.0",
             "Pillow>=9.0",
             "pytesseract>=0.3.10",
+            "orjson>=3.6",
         ],
     },
     entry_points={
@@ -4,8 +4,12 @@ Tests for HPS SVT Component Tracker
 Run with: python -m pytest tests/
 """
 import pytest
+import io
+import json
 import os
+import tarfile
 import tempfile
+import threading
 from datetime import datetime
 
 from hps_svt_tracker import Component, TestResult, Database
@@ -22,6 +26,20 @@ def temp_db():
         yield db
 
 
+@pytest.fixture
+def client(temp_db):
+    """Create a web test client backed by the temporary database"""
+    from web.app import create_app
+    from web.config import DevelopmentConfig
+
+    class TestConfig(DevelopmentConfig):
+        TESTING = True
+        DB_PATH = temp_db.db_path
+        DATA_DIR = temp_db.data_dir
+
+    return create_app(TestConfig).test_client()
+
+
 def test_component_creation(temp_db):
     """Test creating and saving a component"""
     component = Component(
@@ -83,5 +101,383 @@ def test_test_result(temp_db):
     assert history[0]['pass_fail'] == 1  # SQLite stores bool as int
 
 
+def test_non_finite_measurements(temp_db):
+    """Test that NaN measurements are stored as JSON null"""
+    from hps_svt_tracker.models import _json_dumps
+
+    Component(id='TEST-003', type='module', installation_status='testing').save(temp_db)
+    TestResult(component_id='TEST-003', test_type='iv_curve',
+               measurements={'current': float('nan'), 'points': [1.0, float('inf')]}
+               ).save(temp_db)
+
+    history = TestResult.get_for_component('TEST-003', temp_db)
+    assert 'NaN' not in history[0]['measurements_json']
+    assert json.loads(history[0]['measurements_json']) == {'current': None,
+                                                           'points': [1.0, None]}
+
+    # The standard encoder fallback (non-string keys) writes the same form
+    assert json.loads(_json_dumps({1: float('nan')})) == {'1': None}
+
+
+def test_add_maintenance_logs(temp_db):
+    """Test adding maintenance logs in bulk"""
+    from hps_svt_tracker import add_maintenance_logs, get_maintenance_logs
+
+    Component(id='MOD-1', type='module', installation_status='spare').save(temp_db)
+
+    count = add_maintenance_logs([
+        {'component_id': 'MOD-1', 'description': 'first'},
+        {'component_id': 'MOD-1', 'description': 'second', 'log_type': 'repair'},
+    ], db=temp_db)
+    assert count == 2
+    assert len(get_maintenance_logs('MOD-1', temp_db)) == 2
+
+    # Nothing is added if any entry refers to a missing component
+    with pytest.raises(ValueError):
+        add_maintenance_logs([
+            {'component_id': 'MOD-1', 'description': 'third'},
+            {'component_id': 'MISSING', 'description': 'fourth'},
+        ], db=temp_db)
+    assert len(get_maintenance_logs('MOD-1', temp_db)) == 2
+
+
+def test_connection_pragmas(temp_db, tmp_path):
+    """Test the per-connection settings, and that WAL mode is opt-in"""
+    conn = temp_db.get_connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'delete'
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    wal_db = Database(str(tmp_path / 'wal.db'), str(tmp_path / 'wal_data'), wal=True)
+    assert wal_db.get_connection().execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+
+def test_nested_lookup_keeps_transaction(temp_db):
+    """Test that a lookup inside a transaction does not commit it early"""
+    Component(id='MOD-1', type='module', installation_status='spare').save(temp_db)
+
+    with pytest.raises(RuntimeError):
+        with temp_db.transaction() as conn:
+            conn.execute("UPDATE components SET manufacturer = 'X' WHERE id = 'MOD-1'")
+            assert Component.get('MOD-1', temp_db).manufacturer == 'X'
+            raise RuntimeError
+
+    assert Component.get('MOD-1', temp_db).manufacturer is None
+
+
+def test_nested_transaction_rollback(temp_db):
+    """Test that a failed inner transaction only undoes its own changes"""
+    Component(id='MOD-1', type='module', installation_status='spare').save(temp_db)
+
+    with temp_db.transaction() as conn:
+        conn.execute("UPDATE components SET manufacturer = 'X' WHERE id = 'MOD-1'")
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction() as inner:
+                inner.execute("UPDATE components SET notes = 'Y' WHERE id = 'MOD-1'")
+                raise RuntimeError
+
+    component = Component.get('MOD-1', temp_db)
+    assert component.manufacturer == 'X'
+    assert component.notes is None
+
+
+def test_connection_reuse(temp_db):
+    """Test that each thread reuses one connection and released ones are pooled"""
+    conn = temp_db.get_connection()
+    assert temp_db.get_connection() is conn
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(temp_db.get_connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+    temp_db.release_connection()
+    assert temp_db.get_connection() is conn
+
+
+def test_finish_request(temp_db):
+    """Test that finish_request commits on success and rolls back on error"""
+    Component(id='MOD-1', type='module', installation_status='spare').save(temp_db)
+
+    conn = temp_db.get_connection()
+    conn.execute("UPDATE components SET manufacturer = 'A' WHERE id = 'MOD-1'")
+    temp_db.finish_request()
+    assert Component.get('MOD-1', temp_db).manufacturer == 'A'
+
+    conn = temp_db.get_connection()
+    conn.execute("UPDATE components SET manufacturer = 'B' WHERE id = 'MOD-1'")
+    temp_db.finish_request(RuntimeError())
+    assert Component.get('MOD-1', temp_db).manufacturer == 'A'
+
+
+def test_transaction_rollback(temp_db):
+    """Test that transaction() commits on success and rolls back if the block raises"""
+    with temp_db.transaction() as conn:
+        conn.execute("INSERT INTO components (id, type, installation_status) VALUES ('MOD-1', 'module', 'spare')")
+
+    with pytest.raises(RuntimeError):
+        with temp_db.transaction() as conn:
+            conn.execute("INSERT INTO components (id, type, installation_status) VALUES ('MOD-2', 'module', 'spare')")
+            raise RuntimeError
+
+    assert Component.get('MOD-1', temp_db) is not None
+    assert Component.get('MOD-2', temp_db) is None
+
+
+def test_backup_database(temp_db, tmp_path):
+    """Test that backups include recently committed changes"""
+    Component(id='MOD-1', type='module', installation_status='spare').save(temp_db)
+
+    backup_path = temp_db.backup_database(str(tmp_path / 'backup.db'))
+    backup = Database(backup_path, str(tmp_path / 'backup_data'))
+
+    assert Component.get('MOD-1', backup) is not None
+
+
+def test_dashboard_bundle(temp_db):
+    """Test loading sensors with their latest edge imaging test"""
+    from hps_svt_tracker.plotting import load_dashboard_bundle
+
+    Component(id='S-1', type='sensor', installation_status='testing').save(temp_db)
+    Component(id='S-2', type='sensor', installation_status='testing').save(temp_db)
+    Component(id='MOD-1', type='module', installation_status='spare').save(temp_db)
+
+    TestResult(component_id='S-1', test_type='edge_imaging',
+               test_date=datetime(2025, 1, 1),
+               measurements={'edge_gap_mean': 200.0}).save(temp_db)
+    TestResult(component_id='S-1', test_type='edge_imaging',
+               test_date=datetime(2025, 2, 1),
+               measurements={'edge_gap_mean': 210.0}).save(temp_db)
+    TestResult(component_id='S-1', test_type='iv_curve',
+               test_date=datetime(2025, 3, 1)).save(temp_db)
+
+    # Older rows were written by json.dumps, which allows NaN
+    Component(id='S-3', type='sensor', installation_status='testing').save(temp_db)
+    test_id = TestResult(component_id='S-3', test_type='edge_imaging').save(temp_db)
+    with temp_db.get_connection() as conn:
+        conn.execute("UPDATE test_results SET measurements_json = ? WHERE id = ?",
+                     ('{"edge_gap_mean": 190.0, "edge_gap_min": NaN}', test_id))
+
+    bundle = load_dashboard_bundle(temp_db)
+    sensors = {s['sensor_id']: s for s in bundle.sensors}
+
+    assert set(sensors) == {'S-1', 'S-2', 'S-3'}
+    assert sensors['S-1']['edge_test']['measurements']['edge_gap_mean'] == 210.0
+    assert sensors['S-2']['edge_test'] is None
+    assert sensors['S-3']['edge_test']['measurements']['edge_gap_mean'] == 190.0
+
+
+def test_summary_plot_cache(temp_db):
+    """Test that cached summary plots are refreshed when data changes"""
+    from hps_svt_tracker.plotting import generate_edge_imaging_summary
+
+    Component(id='S-1', type='sensor', installation_status='testing').save(temp_db)
+    TestResult(component_id='S-1', test_type='edge_imaging',
+               measurements={'edge_gap_mean': 200.0}).save(temp_db)
+
+    first = generate_edge_imaging_summary(temp_db)
+    assert generate_edge_imaging_summary(temp_db) is first
+
+    Component(id='S-2', type='sensor', installation_status='testing').save(temp_db)
+    TestResult(component_id='S-2', test_type='edge_imaging',
+               measurements={'edge_gap_mean': 210.0}).save(temp_db)
+
+    _, plot_data = generate_edge_imaging_summary(temp_db)
+    assert [d['sensor_id'] for d in plot_data] == ['S-1', 'S-2']
+
+
+def test_bulk_iv_upload(temp_db, client, monkeypatch):
+    """Test bulk IV uploads, and that a failed insert leaves no stored files"""
+    Component(id='W1-S2-2025', type='sensor', installation_status='testing').save(temp_db)
+    Component(id='W2-S2-2025', type='sensor', installation_status='testing').save(temp_db)
+
+    # Fail the insert for the second sensor only
+    insert = TestResult._insert
+
+    def failing_insert(self, conn, data, file_rows):
+        insert(self, conn, data, file_rows)
+        if self.component_id == 'W2-S2-2025':
+            raise ValueError('insert failed')
+
+    monkeypatch.setattr(TestResult, '_insert', failing_insert)
+
+    csv = b"voltage,current\n0,0\n10,1e-9\n"
+    response = client.post('/upload/iv-test', data={
+        'upload_mode': 'bulk',
+        'raw_data': [(io.BytesIO(csv), 'W01_S2_iv.csv'),
+                     (io.BytesIO(csv), 'W02_S2_iv.csv'),
+                     (io.BytesIO(csv), 'W03_S2_iv.csv')],
+    }, content_type='multipart/form-data')
+    assert response.status_code == 302
+
+    history = TestResult.get_for_component('W1-S2-2025', temp_db)
+    assert len(history) == 1
+    stored = TestResult.get_files(history[0]['id'], db=temp_db)
+    assert [f['file_type'] for f in stored] == ['raw_data']
+    assert os.path.exists(os.path.join(temp_db.data_dir, stored[0]['file_path']))
+
+    assert TestResult.get_for_component('W2-S2-2025', temp_db) == []
+    leftover = [name for root, _, names in os.walk(temp_db.data_dir)
+                for name in names if 'W2-S2-2025' in root]
+    assert leftover == []
+
+
+def test_picture_upload(temp_db, client, monkeypatch):
+    """Test picture uploads, including two batches in the same second"""
+    import web.routes.upload as upload
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2025, 1, 1, 12, 0, 0)
+
+    monkeypatch.setattr(upload, 'datetime', FixedDatetime)
+    Component(id='MOD-1', type='module', installation_status='spare').save(temp_db)
+
+    for content in (b'first', b'second'):
+        response = client.post('/upload/picture', data={
+            'component_id': 'MOD-1',
+            'image': [(io.BytesIO(content), 'photo.png'), (io.BytesIO(b'x'), 'notes.txt')],
+        }, content_type='multipart/form-data')
+        assert response.status_code == 302
+
+    with temp_db.get_connection() as conn:
+        paths = [row[0] for row in conn.execute(
+            "SELECT image_path FROM component_images WHERE component_id = 'MOD-1' ORDER BY id")]
+    assert paths == ['images/MOD-1/20250101_120000_00_photo.png',
+                     'images/MOD-1/20250101_120000_00_photo_1.png']
+    contents = [open(os.path.join(temp_db.data_dir, p), 'rb').read() for p in paths]
+    assert contents == [b'first', b'second']
+
+
+def test_maintenance_unknown_component(temp_db, client):
+    """Test that a maintenance entry for a missing component keeps no image"""
+    from hps_svt_tracker import get_maintenance_logs
+
+    response = client.post('/upload/maintenance', data={
+        'component_id': 'MISSING',
+        'description': 'cracked flange',
+        'image': (io.BytesIO(b'image data'), 'crack.png'),
+    }, content_type='multipart/form-data')
+    assert response.status_code == 302
+    assert response.headers['Location'].endswith('/upload/maintenance')
+
+    assert get_maintenance_logs('MISSING', temp_db) == []
+    stored = [name for _, _, names in os.walk(os.path.join(temp_db.data_dir, 'maintenance'))
+              for name in names]
+    assert stored == []
+
+
+def test_flange_qc_put(temp_db, client):
+    """Test uploading flange QC plots as a raw tar body"""
+    Component(id='FL-1', type='flange_board', installation_status='spare').save(temp_db)
+
+    body = io.BytesIO()
+    with tarfile.open(fileobj=body, mode='w:gz') as tf:
+        for name in ('plots/p1.png', 'p2.png', 'readme.txt'):
+            info = tarfile.TarInfo(name)
+            info.size = len(name)
+            tf.addfile(info, io.BytesIO(name.encode()))
+
+    response = client.put('/upload/flange-qc/FL-1/J3?feb_serial=F9&pass_fail=pass',
+                          data=body.getvalue())
+    assert response.status_code == 201
+    test_id = response.get_json()['test_id']
+
+    stored = TestResult.get_files(test_id, db=temp_db)
+    assert sorted(f['original_filename'] for f in stored) == ['J3_p1.png', 'J3_p2.png']
+    assert all(json.loads(f['metadata_json'])['data_input'] == 'J3' for f in stored)
+
+    assert client.put('/upload/flange-qc/FL-1/J2', data=b'').status_code == 404
+    assert client.put('/upload/flange-qc/MISSING/J1', data=b'').status_code == 404
+    assert client.put('/upload/flange-qc/FL-1/J1', data=b'not a tar').status_code == 400
+
+
+def test_maintenance_upload(temp_db, client):
+    """Test adding a maintenance entry with an image"""
+    from hps_svt_tracker import get_maintenance_logs
+
+    Component(id='MOD-1', type='module', installation_status='spare').save(temp_db)
+
+    response = client.post('/upload/maintenance', data={
+        'component_id': 'MOD-1',
+        'description': 'replaced cable',
+        'log_type': 'repair',
+        'image': (io.BytesIO(b'image data'), 'cable photo.jpg'),
+    }, content_type='multipart/form-data')
+    assert response.status_code == 302
+    assert response.headers['Location'].endswith('/components/MOD-1')
+
+    logs = get_maintenance_logs('MOD-1', temp_db)
+    assert [log['log_type'] for log in logs] == ['repair']
+    image_path = logs[0]['image_path']
+    assert image_path.startswith('maintenance/') and image_path.endswith('_cable_photo.jpg')
+    with open(os.path.join(temp_db.data_dir, image_path), 'rb') as f:
+        assert f.read() == b'image data'
+
+
+def test_report_plot_etag(temp_db, client):
+    """Test that report plots carry an ETag and revalidate with 304"""
+    Component(id='S-1', type='sensor', installation_status='testing').save(temp_db)
+    TestResult(component_id='S-1', test_type='edge_imaging',
+               measurements={'edge_gap_mean': 200.0, 'edge_slope_um_per_mm': 1.5}
+               ).save(temp_db)
+
+    response = client.get('/reports/edge-slope.png')
+    assert response.status_code == 200
+    assert response.mimetype == 'image/png'
+    etag = response.headers['ETag']
+
+    revalidated = client.get('/reports/edge-slope.png', headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+
+    # New data gives a new plot, so the old ETag no longer matches
+    TestResult(component_id='S-1', test_type='edge_imaging',
+               measurements={'edge_gap_mean': 210.0, 'edge_slope_um_per_mm': 2.5}
+               ).save(temp_db)
+    changed = client.get('/reports/edge-slope.png', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+
+
+def test_dashboard_stats_cache(temp_db, client, monkeypatch):
+    """Test that dashboard statistics are cached until the data changes or expire"""
+    import web.routes.main as main
+
+    Component(id='MOD-1', type='module', installation_status='spare').save(temp_db)
+
+    assert client.get('/').status_code == 200
+    cached = main._stats_cache['dashboard']
+    assert cached[2][0]['total_components'] == 1
+
+    # Unchanged data within the TTL reuses the cached result
+    assert client.get('/').status_code == 200
+    assert main._stats_cache['dashboard'] is cached
+
+    # A new component changes the sentinel
+    Component(id='MOD-2', type='module', installation_status='installed').save(temp_db)
+    assert client.get('/').status_code == 200
+    cached = main._stats_cache['dashboard']
+    assert cached[2][0]['total_components'] == 2
+    assert cached[2][0]['installed'] == 1
+
+    # Deleting a test other than the newest also changes the sentinel
+    first = TestResult(component_id='MOD-1', test_type='iv_curve').save(temp_db)
+    TestResult(component_id='MOD-1', test_type='iv_curve').save(temp_db)
+    assert client.get('/').status_code == 200
+    assert main._stats_cache['dashboard'][2][0]['recent_tests'] == 2
+    assert client.post(f'/tests/{first}/delete').status_code == 302
+    assert client.get('/').status_code == 200
+    cached = main._stats_cache['dashboard']
+    assert cached[2][0]['recent_tests'] == 1
+
+    # An expired entry is recomputed even if the data has not changed
+    monotonic = main.time.monotonic
+    monkeypatch.setattr(main.time, 'monotonic', lambda: monotonic() + main.STATS_TTL + 1)
+    assert client.get('/').status_code == 200
+    assert main._stats_cache['dashboard'] is not cached
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
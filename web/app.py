@@ -1,20 +1,106 @@
 """
 Flask application factory for HPS SVT Tracker web interface
 """
+import functools
+import os
+import sys
+import tempfile
 from datetime import datetime
-from flask import Flask, g, render_template
+from flask import Flask, Request, current_app, g, render_template
+from jinja2 import FileSystemBytecodeCache
 from hps_svt_tracker.database import Database, get_default_db
 from .config import DevelopmentConfig
+from .routes.main import main_bp
+from .routes.components import components_bp
+from .routes.tests import tests_bp
+from .routes.files import files_bp
+from .routes.upload import upload_bp, upload_temp_dir
+from .routes.reports import reports_bp
+
+
+# From Python 3.11 fromisoformat accepts any ISO 8601 timestamp, including
+# fractional seconds of any length; earlier versions need strptime for those
+_FULL_FROMISOFORMAT = sys.version_info >= (3, 11)
+
+# Ordinal suffixes indexed by the last digit of the day
+_ORDINAL = ('th', 'st', 'nd', 'rd', 'th', 'th', 'th', 'th', 'th', 'th')
 
 
 def _ordinal_suffix(day):
     """Return the ordinal suffix for a day number (st, nd, rd, th)."""
     if 11 <= day <= 13:
         return 'th'
-    return {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+    return _ORDINAL[day % 10]
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_date(date_str, include_time):
+    """
+    Format an ISO date string for display.
+
+    Cached because the same timestamps repeat across table rows.
+    """
+    try:
+        # Handle both "T" separator and space separator
+        date_str = date_str.replace('T', ' ')
+        # Parse the date string (handle with or without microseconds)
+        if _FULL_FROMISOFORMAT:
+            dt = datetime.fromisoformat(date_str)
+        elif '.' in date_str:
+            dt = datetime.strptime(date_str[:26], '%Y-%m-%d %H:%M:%S.%f')
+        else:
+            dt = datetime.strptime(date_str[:19], '%Y-%m-%d %H:%M:%S')
+
+        day = dt.day
+        suffix = _ordinal_suffix(day)
+
+        if include_time:
+            return dt.strftime(f'%B {day}{suffix}, %Y %H:%M:%S')
+        else:
+            return dt.strftime(f'%B {day}{suffix}, %Y')
+    except ValueError:
+        # Return original if parsing fails
+        return date_str
+
+
+# Form templates compiled when the app starts rather than on first visit
+PRELOADED_TEMPLATES = (
+    'upload/maintenance.html',
+    'upload/installation.html',
+)
+
+# Requests larger than this write their file parts straight to disk
+UPLOAD_SPOOL_THRESHOLD = 500 * 1024
+
+
+class UploadRequest(Request):
+    """
+    Request that writes large multipart file parts directly to data storage.
+
+    Werkzeug's default buffers each file part in memory and copies it to
+    the system temp dir once it passes 500 KB. Large uploads instead stream
+    into a named temp file under data_dir/.tmp while the form is parsed, so
+    the upload routes can hard-link them into storage without copying.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        if total_content_length is None or total_content_length > UPLOAD_SPOOL_THRESHOLD:
+            temp_dir = upload_temp_dir(current_app.extensions['db'])
+            return tempfile.NamedTemporaryFile('w+b', dir=temp_dir)
+        return super()._get_file_stream(total_content_length, content_type,
+                                        filename, content_length)
+
+
+class _DisplayNames(dict):
+    """Display name mapping that falls back to the internal name"""
+
+    def __missing__(self, key):
+        return key
+
 
 # Display name mappings for component types
-COMPONENT_TYPE_DISPLAY_NAMES = {
+COMPONENT_TYPE_DISPLAY_NAMES = _DisplayNames({
     'module': 'Module',
     'hybrid': 'Hybrid',
     'sensor': 'Sensor',
@@ -25,7 +111,7 @@ COMPONENT_TYPE_DISPLAY_NAMES = {
     'mpod_crate': 'MPOD Crate',
     'flange_board': 'Flange Board',
     'other': 'Other',
-}
+})
 
 # Display name mappings for test types
 TEST_TYPE_DISPLAY_NAMES = {
@@ -51,29 +137,41 @@ def create_app(config_class=DevelopmentConfig):
         Configured Flask application
     """
     app = Flask(__name__)
+    app.request_class = UploadRequest
     app.config.from_object(config_class)
 
-    # Database setup - create database instance before each request
+    # Reuse compiled templates across restarts and workers when configured
+    if app.config.get('TEMPLATE_BYTECODE_CACHE'):
+        template_cache_dir = app.config.get('TEMPLATE_CACHE_DIR')
+        if template_cache_dir:
+            os.makedirs(template_cache_dir, mode=0o700, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(template_cache_dir)
+
+    # Compile the hot form templates up front (from the bytecode cache when
+    # one is configured)
+    for template_name in PRELOADED_TEMPLATES:
+        app.jinja_env.get_template(template_name)
+
+    # Database setup - one instance for the app, each thread reuses its
+    # own connection across requests
+    db_path = app.config.get('DB_PATH')
+    data_dir = app.config.get('DATA_DIR')
+    if db_path:
+        app.extensions['db'] = Database(db_path=db_path, data_dir=data_dir)
+    else:
+        app.extensions['db'] = get_default_db()
+
     @app.before_request
     def setup_db():
         """Set up database connection in Flask request context"""
-        if 'db' not in g:
-            db_path = app.config.get('DB_PATH')
-            data_dir = app.config.get('DATA_DIR')
+        g.db = app.extensions['db']
 
-            if db_path:
-                g.db = Database(db_path=db_path, data_dir=data_dir)
-            else:
-                g.db = get_default_db()
+    @app.teardown_appcontext
+    def finish_db(error):
+        """Commit or roll back anything a request left open"""
+        app.extensions['db'].finish_request(error)
 
     # Register blueprints
-    from .routes.main import main_bp
-    from .routes.components import components_bp
-    from .routes.tests import tests_bp
-    from .routes.files import files_bp
-    from .routes.upload import upload_bp
-    from .routes.reports import reports_bp
-
     app.register_blueprint(main_bp)
     app.register_blueprint(components_bp, url_prefix='/components')
     app.register_blueprint(tests_bp, url_prefix='/tests')
@@ -101,11 +199,9 @@ def create_app(config_class=DevelopmentConfig):
             'app_version': '0.1.0'
         }
 
-    # Custom Jinja filter for display names
-    @app.template_filter('display_type')
-    def display_type_filter(type_name):
-        """Convert internal component type name to human-readable display name"""
-        return COMPONENT_TYPE_DISPLAY_NAMES.get(type_name, type_name)
+    # Custom Jinja filter for display names; the mapping lookup is
+    # registered directly since it runs for every table cell
+    app.add_template_filter(COMPONENT_TYPE_DISPLAY_NAMES.__getitem__, 'display_type')
 
     @app.template_filter('display_test_type')
     def display_test_type_filter(test_type):
@@ -133,24 +229,6 @@ def create_app(config_class=DevelopmentConfig):
         if not date_str:
             return 'N/A'
 
-        try:
-            # Handle both "T" separator and space separator
-            date_str = str(date_str).replace('T', ' ')
-            # Parse the date string (handle with or without microseconds)
-            if '.' in date_str:
-                dt = datetime.strptime(date_str[:26], '%Y-%m-%d %H:%M:%S.%f')
-            else:
-                dt = datetime.strptime(date_str[:19], '%Y-%m-%d %H:%M:%S')
-
-            day = dt.day
-            suffix = _ordinal_suffix(day)
-
-            if include_time:
-                return dt.strftime(f'%B {day}{suffix}, %Y %H:%M:%S')
-            else:
-                return dt.strftime(f'%B {day}{suffix}, %Y')
-        except (ValueError, TypeError):
-            # Return original if parsing fails
-            return date_str
+        return _format_date(str(date_str), bool(include_time))
 
     return app
@@ -17,9 +17,25 @@ class Config:
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
 
+    # Optional hard cap on request bodies, enforced by Werkzeug before any
+    # route runs (bytes; unset = no limit, as tar uploads can be large)
+    MAX_CONTENT_LENGTH = int(os.environ['SVT_MAX_CONTENT_LENGTH']) \
+        if os.environ.get('SVT_MAX_CONTENT_LENGTH') else None
+
+    # Bulk IV and picture uploads send one multipart part per file, so allow
+    # far more than Werkzeug's default of 1000 parts (honoured by Flask 3.1+)
+    MAX_FORM_PARTS = int(os.environ.get('SVT_MAX_FORM_PARTS') or 10000)
+
     # Pagination
     ITEMS_PER_PAGE = 50
 
+    # Served data files (images, raw data) rarely change once uploaded
+    FILES_MAX_AGE = 86400  # seconds
+
+    # Hand file transfers to the front-end server (nginx/Apache) when one is
+    # configured to honour X-Sendfile
+    USE_X_SENDFILE = os.environ.get('SVT_USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -31,6 +47,13 @@ class DevelopmentConfig(Config):
 class ProductionConfig(Config):
     """Production configuration"""
     DEBUG = False
+    TEMPLATES_AUTO_RELOAD = False
+
+    # Compiled templates are cached on disk and shared by all workers. The
+    # cache is loaded as code, so unless a directory is given Jinja's own
+    # per-user, owner-checked directory under the temp dir is used
+    TEMPLATE_BYTECODE_CACHE = True
+    TEMPLATE_CACHE_DIR = os.environ.get('SVT_TEMPLATE_CACHE_DIR')
 
     @property
     def SECRET_KEY(self):
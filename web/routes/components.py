@@ -51,19 +51,20 @@ def list_components():
 def component_detail(component_id):
     """Show detailed information for a specific component"""
 
-    # Get the component
-    component = Component.get(component_id, g.db)
-    if not component:
-        abort(404, description=f"Component '{component_id}' not found")
-
-    # Get related data using existing model methods
-    tests = TestResult.get_for_component(component_id, g.db)
-    logs = get_maintenance_logs(component_id, g.db)
-    connections = get_connections_for_component(component_id, g.db)
-    images = get_component_images(component_id, g.db)
-
-    # Get installation history
+    # All lookups share one connection block, i.e. one transaction
     with g.db.get_connection() as conn:
+        # Get the component
+        component = Component.get(component_id, conn=conn)
+        if not component:
+            abort(404, description=f"Component '{component_id}' not found")
+
+        # Get related data using existing model methods
+        tests = TestResult.get_for_component(component_id, conn=conn)
+        logs = get_maintenance_logs(component_id, conn=conn)
+        connections = get_connections_for_component(component_id, conn=conn)
+        images = get_component_images(component_id, conn=conn)
+
+        # Get installation history
         installations = conn.execute("""
             SELECT *
             FROM installation_history
@@ -71,18 +72,16 @@ def component_detail(component_id):
             ORDER BY installation_date DESC
         """, (component_id,)).fetchall()
 
-    # Check if this component is used in any module assembly
-    assembly_info = None
-    if component.type in ['sensor', 'hybrid']:
-        with g.db.get_connection() as conn:
-            if component.type == 'sensor':
-                assembly_info = conn.execute("""
-                    SELECT id, type FROM components WHERE assembled_sensor_id = ?
-                """, (component_id,)).fetchone()
-            else:  # hybrid
-                assembly_info = conn.execute("""
-                    SELECT id, type FROM components WHERE assembled_hybrid_id = ?
-                """, (component_id,)).fetchone()
+        # Check if this component is used in any module assembly
+        assembly_info = None
+        if component.type == 'sensor':
+            assembly_info = conn.execute("""
+                SELECT id, type FROM components WHERE assembled_sensor_id = ?
+            """, (component_id,)).fetchone()
+        elif component.type == 'hybrid':
+            assembly_info = conn.execute("""
+                SELECT id, type FROM components WHERE assembled_hybrid_id = ?
+            """, (component_id,)).fetchone()
 
     return render_template('components/detail.html',
                          component=component,
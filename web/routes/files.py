@@ -2,13 +2,20 @@
 Secure file serving for test data files
 Prevents directory traversal attacks and validates file paths
 """
-from flask import Blueprint, send_from_directory, g, abort
+from flask import Blueprint, current_app, send_from_directory, g, abort
+import functools
 import os
 
 
 files_bp = Blueprint('files', __name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _real_data_dir(data_dir):
+    """Resolve the data directory once; it is fixed for the process lifetime"""
+    return os.path.realpath(data_dir)
+
+
 @files_bp.route('/<path:filepath>')
 def serve_file(filepath):
     """
@@ -30,9 +37,11 @@ def serve_file(filepath):
 
     # Ensure the final path is still within data_dir (prevent symlink attacks)
     real_full_path = os.path.realpath(full_path)
-    real_data_dir = os.path.realpath(g.db.data_dir)
+    real_data_dir = _real_data_dir(g.db.data_dir)
 
-    if not real_full_path.startswith(real_data_dir):
+    # Compare against the directory with a trailing separator so that a
+    # sibling such as "data_evil" does not pass as inside "data"
+    if not real_full_path.startswith(real_data_dir + os.sep):
         abort(403, description="Access denied: path outside data directory")
 
     # Check if file exists
@@ -47,4 +56,7 @@ def serve_file(filepath):
     directory = os.path.dirname(real_full_path)
     filename = os.path.basename(real_full_path)
 
-    return send_from_directory(directory, filename)
+    # Let browsers revalidate cached files with If-Modified-Since/ETag
+    # instead of downloading them again
+    return send_from_directory(directory, filename, conditional=True, etag=True,
+                               max_age=current_app.config.get('FILES_MAX_AGE'))
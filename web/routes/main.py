@@ -3,12 +3,73 @@ Main routes for HPS SVT Tracker web interface
 Includes homepage, dashboard, and general pages
 """
 import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from flask import Blueprint, render_template, g
 from hps_svt_tracker.models import TestResult
 
 
 main_bp = Blueprint('main', __name__)
 
+# Dashboard statistics are reused for up to STATS_TTL seconds as long as
+# the components/test_results sentinel is unchanged
+STATS_TTL = 30
+_stats_cache = {}
+_stats_lock = threading.Lock()
+
+
+def _dashboard_stats(conn):
+    """
+    Get the homepage statistics and component counts by type.
+
+    A cheap sentinel query (component count and latest update, test count
+    and newest test id) decides whether the cached result is still valid,
+    so edits, new tests and deleted tests show up on the next page load
+    while repeat visits skip the aggregation.
+    """
+    sentinel = tuple(conn.execute("""
+        SELECT (SELECT COUNT(*) FROM components),
+               (SELECT MAX(updated_at) FROM components),
+               (SELECT COUNT(*) FROM test_results),
+               (SELECT MAX(id) FROM test_results)
+    """).fetchone())
+    key = (g.db.db_path, sentinel)
+    now = time.monotonic()
+
+    with _stats_lock:
+        cached = _stats_cache.get('dashboard')
+    if cached and cached[0] == key and cached[1] > now:
+        return cached[2]
+
+    # Same cutoff as SQLite's date('now', '-30 days') (a UTC date), bound as
+    # a constant so the planner can start the index range scan from it
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=30)).strftime('%Y-%m-%d')
+    stats = dict(conn.execute("""
+        SELECT
+            COUNT(*) AS total_components,
+            COALESCE(SUM(installation_status = 'installed'), 0) AS installed,
+            COALESCE(SUM(installation_status = 'spare'), 0) AS spare,
+            COALESCE(SUM(installation_status = 'testing'), 0) AS testing,
+            (SELECT COUNT(*) FROM test_results
+             WHERE test_date > ?) AS recent_tests
+        FROM components
+    """, (cutoff,)).fetchone())
+
+    # Get component counts by type (limit to 10)
+    component_counts = conn.execute("""
+        SELECT type, COUNT(*) as count
+        FROM components
+        GROUP BY type
+        ORDER BY count DESC
+        LIMIT 10
+    """).fetchall()
+
+    result = (stats, component_counts)
+    with _stats_lock:
+        _stats_cache['dashboard'] = (key, now + STATS_TTL, result)
+    return result
+
 
 @main_bp.route('/')
 def index():
@@ -16,54 +77,19 @@ def index():
 
     # Get statistics
     with g.db.get_connection() as conn:
-        stats = {
-            'total_components': conn.execute(
-                "SELECT COUNT(*) as count FROM components"
-            ).fetchone()['count'],
-
-            'installed': conn.execute(
-                "SELECT COUNT(*) as count FROM components WHERE installation_status='installed'"
-            ).fetchone()['count'],
-
-            'spare': conn.execute(
-                "SELECT COUNT(*) as count FROM components WHERE installation_status='spare'"
-            ).fetchone()['count'],
-
-            'testing': conn.execute(
-                "SELECT COUNT(*) as count FROM components WHERE installation_status='testing'"
-            ).fetchone()['count'],
-
-            'recent_tests': conn.execute(
-                "SELECT COUNT(*) as count FROM test_results WHERE test_date > date('now', '-30 days')"
-            ).fetchone()['count']
-        }
-
-        # Get component counts by type (limit to 10)
-        component_counts = conn.execute("""
-            SELECT type, COUNT(*) as count
-            FROM components
-            GROUP BY type
-            ORDER BY count DESC
-            LIMIT 10
-        """).fetchall()
+        stats, component_counts = _dashboard_stats(conn)
 
-        # Get recent photos (last 10)
-        recent_photos_raw = conn.execute("""
-            SELECT ci.id, ci.component_id, ci.image_path, ci.description,
-                   ci.uploaded_by, ci.upload_date
+        # Get recent photos (last 10), with the URL path for serving via
+        # the files blueprint built in SQL
+        recent_photos = conn.execute("""
+            SELECT ci.id, ci.component_id, ci.image_path,
+                   '/files/' || ci.image_path AS image_url,
+                   ci.description, ci.uploaded_by, ci.upload_date
             FROM component_images ci
             ORDER BY ci.upload_date DESC
             LIMIT 10
         """).fetchall()
 
-        # Convert to list of dicts and add full path for serving
-        recent_photos = []
-        for photo in recent_photos_raw:
-            photo_dict = dict(photo)
-            # Build relative URL path for serving via files blueprint
-            photo_dict['image_url'] = f"/files/{photo['image_path']}"
-            recent_photos.append(photo_dict)
-
     # Get recent tests (last 10)
     recent_tests = TestResult.get_recent(days=30, db=g.db)[:10]
 
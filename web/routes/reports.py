@@ -3,9 +3,15 @@ Report routes for HPS SVT Tracker web interface
 
 Provides summary plots and reports across components.
 """
-from flask import Blueprint, render_template, g, Response
+import functools
+import hashlib
+import io
+
+from flask import Blueprint, render_template, g, send_file
 
 from hps_svt_tracker.plotting import (
+    load_dashboard_bundle,
+    render_summary_plots,
     generate_edge_imaging_summary,
     generate_edge_imaging_minmax,
     generate_edge_imaging_lcr_plot,
@@ -18,68 +24,70 @@ from hps_svt_tracker.plotting import (
 
 reports_bp = Blueprint('reports', __name__)
 
+# Browsers may reuse a plot for this long before revalidating it
+PLOT_MAX_AGE = 60
 
-@reports_bp.route('/edge-imaging-summary')
-def edge_imaging_summary():
-    """Display the edge imaging summary page with plot"""
-    # Generate plot to get the list of sensors included
-    _, sensor_data = generate_edge_imaging_summary(db=g.db)
-
-    return render_template('reports/edge_imaging_summary.html',
-                         sensor_data=sensor_data)
-
-
-@reports_bp.route('/edge-imaging-summary.png')
-def edge_imaging_summary_image():
-    """Return the edge imaging summary plot as PNG image"""
-    image_bytes, _ = generate_edge_imaging_summary(db=g.db)
 
-    return Response(image_bytes, mimetype='image/png')
+@functools.lru_cache(maxsize=64)
+def _png_etag(image_bytes):
+    """
+    Content hash for a rendered plot.
 
+    The generators return the same cached bytes object until the data
+    changes, and bytes objects cache their own hash, so repeat lookups
+    here cost a dict probe rather than rehashing the image.
+    """
+    return hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
 
-@reports_bp.route('/edge-imaging-minmax.png')
-def edge_imaging_minmax_image():
-    """Return the edge imaging min/max plot as PNG image"""
-    image_bytes, _ = generate_edge_imaging_minmax(db=g.db)
 
-    return Response(image_bytes, mimetype='image/png')
+def _png_response(image_bytes):
+    """
+    Send a rendered plot as PNG.
 
+    send_file adds Content-Length and handles If-None-Match (304) and
+    Range requests against the content-hash ETag.
+    """
+    return send_file(io.BytesIO(image_bytes), mimetype='image/png',
+                     conditional=True, etag=_png_etag(image_bytes),
+                     max_age=PLOT_MAX_AGE)
 
-@reports_bp.route('/edge-imaging-lcr.png')
-def edge_imaging_lcr_image():
-    """Return the edge imaging L/C/R position plot as PNG image"""
-    image_bytes, _ = generate_edge_imaging_lcr_plot(db=g.db)
-
-    return Response(image_bytes, mimetype='image/png')
-
-
-@reports_bp.route('/edge-slope.png')
-def edge_slope_image():
-    """Return the edge slope plot as PNG image"""
-    image_bytes, _ = generate_edge_slope_plot(db=g.db)
-
-    return Response(image_bytes, mimetype='image/png')
 
+@reports_bp.route('/edge-imaging-summary')
+def edge_imaging_summary():
+    """Display the edge imaging summary page with plot"""
+    # Render every plot on the page up front so the image requests that
+    # follow are served from cache; the summary plot also gives us the
+    # list of sensors included
+    bundle = load_dashboard_bundle(g.db)
+    plots = render_summary_plots(bundle=bundle)
+    _, sensor_data = plots['edge_imaging_summary']
 
-@reports_bp.route('/cleaving-distance.png')
-def cleaving_distance_image():
-    """Return the cleaving distance plot as PNG image"""
-    image_bytes, _ = generate_cleaving_distance_plot(db=g.db)
+    return render_template('reports/edge_imaging_summary.html',
+                         sensor_data=sensor_data)
 
-    return Response(image_bytes, mimetype='image/png')
 
+# Plot image routes: (URL rule, endpoint, generator). Endpoint names are
+# what templates pass to url_for
+PLOT_ROUTES = [
+    ('/edge-imaging-summary.png', 'edge_imaging_summary_image', generate_edge_imaging_summary),
+    ('/edge-imaging-minmax.png', 'edge_imaging_minmax_image', generate_edge_imaging_minmax),
+    ('/edge-imaging-lcr.png', 'edge_imaging_lcr_image', generate_edge_imaging_lcr_plot),
+    ('/edge-slope.png', 'edge_slope_image', generate_edge_slope_plot),
+    ('/cleaving-distance.png', 'cleaving_distance_image', generate_cleaving_distance_plot),
+    ('/leakage-current.png', 'leakage_current_image', generate_leakage_current_plot),
+    ('/edge-correlation.png', 'edge_correlation_image', generate_edge_correlation_plots),
+]
 
-@reports_bp.route('/leakage-current.png')
-def leakage_current_image():
-    """Return the leakage current plot as PNG image"""
-    image_bytes, _ = generate_leakage_current_plot(db=g.db)
 
-    return Response(image_bytes, mimetype='image/png')
+def _make_png_view(generator):
+    """Create a view that returns the generator's plot as PNG image"""
+    def view():
+        image_bytes, _ = generator(db=g.db)
+        return _png_response(image_bytes)
 
+    view.__doc__ = f"Return the {generator.__name__} plot as PNG image"
+    return view
 
-@reports_bp.route('/edge-correlation.png')
-def edge_correlation_image():
-    """Return the edge correlation plot as PNG image"""
-    image_bytes, _ = generate_edge_correlation_plots(db=g.db)
 
-    return Response(image_bytes, mimetype='image/png')
+for rule, endpoint, generator in PLOT_ROUTES:
+    reports_bp.add_url_rule(rule, endpoint=endpoint, view_func=_make_png_view(generator))
@@ -6,6 +6,34 @@ from flask import Blueprint, render_template, g, abort, request, redirect, url_f
 import json
 from hps_svt_tracker.models import TestResult
 
+# Use orjson's faster parser when it is installed; it raises a subclass of
+# json.JSONDecodeError, so error handling is the same either way
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(text):
+    """
+    Parse stored JSON, with orjson when available.
+
+    New rows store NaN/Infinity as null, but rows written before that by
+    json.dumps may contain bare NaN/Infinity tokens, which orjson rejects;
+    those fall back to json.loads.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+# Stored JSON values that carry no metadata; these skip the parser
+_EMPTY_JSON = frozenset(('{}', '[]', 'null', '""'))
+
 
 tests_bp = Blueprint('tests', __name__)
 
@@ -25,9 +53,9 @@ def test_detail(test_id):
     # Parse metadata_json for each file
     for file_type, files in files_by_type.items():
         for f in files:
-            if f.get('metadata_json'):
+            if f.get('metadata_json') and f['metadata_json'] not in _EMPTY_JSON:
                 try:
-                    f['metadata_json'] = json.loads(f['metadata_json'])
+                    f['metadata_json'] = _json_loads(f['metadata_json'])
                 except (json.JSONDecodeError, TypeError):
                     f['metadata_json'] = {}
             else:
@@ -37,7 +65,7 @@ def test_detail(test_id):
     measurements_dict = {}
     if test.get('measurements_json'):
         try:
-            measurements_dict = json.loads(test['measurements_json'])
+            measurements_dict = _json_loads(test['measurements_json'])
         except (json.JSONDecodeError, TypeError):
             measurements_dict = {}
 
@@ -50,11 +78,6 @@ def test_detail(test_id):
 @tests_bp.route('/<int:test_id>/update-result', methods=['POST'])
 def update_result(test_id):
     """Update the pass/fail result of a test"""
-    # Get the test result to verify it exists
-    test = TestResult.get_by_id(test_id, g.db)
-    if not test:
-        abort(404, description=f"Test result #{test_id} not found")
-
     # Get the new result value from the form
     result = request.form.get('result')
 
@@ -66,12 +89,14 @@ def update_result(test_id):
     else:  # 'na' or anything else
         pass_fail = None
 
-    # Update the database
+    # Update the database; no matched row means the test does not exist
     with g.db.get_connection() as conn:
-        conn.execute(
+        cursor = conn.execute(
             "UPDATE test_results SET pass_fail = ? WHERE id = ?",
             [pass_fail, test_id]
         )
+        if cursor.rowcount == 0:
+            abort(404, description=f"Test result #{test_id} not found")
         conn.commit()
 
     flash(f"Test result updated successfully", "success")
@@ -81,20 +106,19 @@ def update_result(test_id):
 @tests_bp.route('/<int:test_id>/delete', methods=['POST'])
 def delete_test(test_id):
     """Delete a test result and its associated files"""
-    # Get the test result to verify it exists and get component_id for redirect
-    test = TestResult.get_by_id(test_id, g.db)
-    if not test:
-        abort(404, description=f"Test result #{test_id} not found")
-
-    component_id = test['component_id']
-
-    # Delete associated files from database (actual files remain on disk)
-    with g.db.get_connection() as conn:
-        # Delete test files records
-        conn.execute("DELETE FROM test_files WHERE test_id = ?", [test_id])
-        # Delete the test result
+    # Delete the test result; its test_files records go with it through
+    # ON DELETE CASCADE (actual files remain on disk). The component to
+    # redirect to is looked up in the same transaction (DELETE ... RETURNING
+    # would need SQLite 3.35)
+    with g.db.transaction() as conn:
+        row = conn.execute(
+            "SELECT component_id FROM test_results WHERE id = ?", [test_id]
+        ).fetchone()
+        if row is None:
+            abort(404, description=f"Test result #{test_id} not found")
         conn.execute("DELETE FROM test_results WHERE id = ?", [test_id])
-        conn.commit()
+
+    component_id = row['component_id']
 
     flash(f"Test #{test_id} deleted successfully", "success")
     return redirect(url_for('components.component_detail', component_id=component_id))
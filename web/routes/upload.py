@@ -5,19 +5,43 @@ Handles file uploads including component images and test results
 import os
 import re
 import getpass
+import hashlib
+import io
+import sys
 import tempfile
 import tarfile
-import json
+import threading
+import time
+import unicodedata
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime
-from pathlib import Path
-from flask import Blueprint, render_template, request, g, redirect, url_for, flash
+from functools import lru_cache
+from flask import Blueprint, render_template, request, g, redirect, url_for, flash, jsonify
+from markupsafe import Markup, escape
+from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 from hps_svt_tracker.models import Component, TestResult, add_maintenance_log, install_component
 
 
 upload_bp = Blueprint('upload', __name__)
 
+# Uploaded files are written to disk concurrently; the writes release the GIL
+_save_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='svt-upload')
+
+# Bulk IV files are analyzed concurrently; file parsing and plot rendering
+# are thread-safe and largely run in numpy/Agg without the GIL
+_analysis_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                    thread_name_prefix='svt-analysis')
+
+# Removes finished uploads' temp directories off the request thread
+_cleanup_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='svt-cleanup')
+
+# Sensor ID prefix of IV data filenames: W followed by digits, underscore,
+# S followed by digit(s). Examples: W01_S2, W03_S5, W12_S10
+_SENSOR_ID_RE = re.compile(r'^W(\d+)_S(\d+)', re.IGNORECASE)
+
 
 def parse_sensor_id_from_filename(filename):
     """
@@ -32,12 +56,9 @@ def parse_sensor_id_from_filename(filename):
     Returns:
         Tuple of (sensor_id, success). If parsing fails, returns (None, False).
     """
-    # Get just the filename without path
-    basename = Path(filename).stem
-
-    # Match pattern: W followed by digits, underscore, S followed by digit(s)
-    # Examples: W01_S2, W03_S5, W12_S10
-    match = re.match(r'^W(\d+)_S(\d+)', basename, re.IGNORECASE)
+    # Get just the filename without path; the pattern is anchored at the
+    # start, so the extension can stay on
+    match = _SENSOR_ID_RE.match(os.path.basename(filename))
 
     if match:
         # Remove leading zeros from wafer number
@@ -50,48 +71,313 @@ def parse_sensor_id_from_filename(filename):
     return None, False
 
 # Allowed image extensions
-ALLOWED_IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff', 'tif'}
+ALLOWED_IMAGE_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff', 'tif'})
 
 # Allowed data file extensions
-ALLOWED_DATA_EXTENSIONS = {'csv', 'txt', 'dat', 'tsv', 'hdf5', 'h5', 'root', 'json', 'xlsx', 'xls'}
+ALLOWED_DATA_EXTENSIONS = frozenset({'csv', 'txt', 'dat', 'tsv', 'hdf5', 'h5', 'root', 'json', 'xlsx', 'xls'})
 
 # Legacy alias
 ALLOWED_EXTENSIONS = ALLOWED_IMAGE_EXTENSIONS
 
+# Longest user-supplied filename stem kept in stored picture names
+MAX_STORED_STEM_LENGTH = 64
+
+# Characters replaced by split_safe_filename
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9._-]+')
+
+# Tar members larger than this are skipped rather than extracted
+MAX_TAR_MEMBER_BYTES = 64 * 1024 * 1024
+
+# Maintenance log posts (comment plus one optional image) larger than this
+# are turned away before the body is read
+MAX_MAINTENANCE_UPLOAD_BYTES = 50 * 1024 * 1024
+
+# Chunk size for copying extracted and uploaded file data
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Permissions of stored uploads, whether they were linked or copied into
+# place (set explicitly so they do not depend on the path taken)
+STORED_FILE_MODE = 0o644
+
+# Dotted suffixes for str.endswith, which checks them all in one C-level call
+_IMAGE_SUFFIXES = tuple('.' + ext for ext in ALLOWED_IMAGE_EXTENSIONS)
+_DATA_SUFFIXES = tuple('.' + ext for ext in ALLOWED_DATA_EXTENSIONS)
+
+
+@lru_cache(maxsize=16)
+def _suffixes(allowed_extensions):
+    """Dotted suffix tuple for a frozenset of extensions"""
+    return tuple('.' + ext for ext in allowed_extensions)
+
 
 def allowed_file(filename, allowed_extensions=None):
     """Check if file has an allowed extension"""
     if allowed_extensions is None:
-        allowed_extensions = ALLOWED_EXTENSIONS
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in allowed_extensions
+        suffixes = _IMAGE_SUFFIXES
+    else:
+        suffixes = _suffixes(frozenset(allowed_extensions))
+    return filename.lower().endswith(suffixes)
 
 
 def allowed_image(filename):
     """Check if file is an allowed image type"""
-    return allowed_file(filename, ALLOWED_IMAGE_EXTENSIONS)
+    return filename.lower().endswith(_IMAGE_SUFFIXES)
 
 
 def allowed_data(filename):
     """Check if file is an allowed data type"""
-    return allowed_file(filename, ALLOWED_DATA_EXTENSIONS)
+    return filename.lower().endswith(_DATA_SUFFIXES)
 
 
-def save_temp_file(uploaded_file):
-    """Save uploaded file to temp directory and return the path"""
+def upload_temp_dir(db):
+    """
+    Scratch directory for uploads that will end up in data storage.
+
+    It lives under data_dir so that TestResult.save(move_files=True) can
+    rename the files into place instead of copying them across filesystems.
+    """
+    temp_dir = os.path.join(db.data_dir, '.tmp')
+    os.makedirs(temp_dir, exist_ok=True)
+    return temp_dir
+
+
+def split_safe_filename(filename):
+    """
+    Sanitize an uploaded filename and split it into (stem, extension).
+
+    Every run of characters other than letters, digits, '.', '_' and '-'
+    becomes '_', so path separators cannot survive; the extension is
+    lowercased. Only for names that are stored behind a server-generated
+    prefix (e.g. a timestamp), which keeps leading dots harmless.
+    """
+    if not filename.isascii():
+        # Keep accented letters as their ASCII base, as secure_filename does
+        filename = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+    name = _UNSAFE_FILENAME_CHARS.sub('_', filename)
+    dot = name.rfind('.')
+    if dot > 0:
+        return name[:dot], name[dot:].lower()
+    return name, ''
+
+
+def save_temp_file(uploaded_file, target_dir=None):
+    """
+    Save uploaded file to temp directory and return the path
+
+    Args:
+        uploaded_file: Werkzeug FileStorage object
+        target_dir: Directory for the temp file (default: system temp dir)
+    """
     if not uploaded_file or uploaded_file.filename == '':
         return None
 
-    # Create a temp file with the original extension
-    ext = Path(uploaded_file.filename).suffix
-    fd, temp_path = tempfile.mkstemp(suffix=ext)
-    os.close(fd)
-    uploaded_file.save(temp_path)
+    # Create a temp file with the original extension. mkstemp picks an
+    # unused name, which is freed again so write_new_file can link or copy
+    # the upload there; if another process takes the name in between, try
+    # a fresh one
+    ext = os.path.splitext(uploaded_file.filename)[1]
+    while True:
+        fd, temp_path = tempfile.mkstemp(suffix=ext, dir=target_dir)
+        os.close(fd)
+        os.unlink(temp_path)
+        try:
+            write_new_file(uploaded_file, temp_path)
+        except FileExistsError:
+            continue
+        return temp_path
+
+
+def link_upload(uploaded_file, filepath):
+    """
+    Hard-link an upload that was spooled to a named temp file into place.
+
+    Large requests are parsed straight into named files under data_dir/.tmp
+    (see UploadRequest), so saving them needs no copy. Returns False without
+    touching filepath if the upload is held in memory or cannot be linked
+    (e.g. data on another filesystem); the caller then copies it. An
+    existing filepath raises FileExistsError.
+    """
+    src = uploaded_file.stream
+    name = getattr(src, 'name', None)
+    if not isinstance(name, str):
+        return False
+    src.flush()
+    try:
+        os.chmod(name, STORED_FILE_MODE)
+        os.link(name, filepath)
+    except FileExistsError:
+        raise
+    except OSError:
+        return False
+    return True
+
+
+def write_new_file(uploaded_file, filepath):
+    """
+    Store an uploaded file as a new file at filepath.
+
+    The upload is hard-linked when possible, otherwise copied through one
+    reused COPY_BUFFER_SIZE buffer. The file is created with O_EXCL, so an
+    existing file raises FileExistsError instead of being overwritten.
+    """
+    if link_upload(uploaded_file, filepath):
+        return
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, STORED_FILE_MODE)
+    os.fchmod(fd, STORED_FILE_MODE)
+    with open(fd, 'wb', buffering=0) as dst:
+        src = uploaded_file.stream
+        if not hasattr(src, 'readinto'):
+            # SpooledTemporaryFile only has readinto from Python 3.11
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+            return
+        buf = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = src.readinto(buf)
+            if not n:
+                break
+            written = 0
+            while written < n:
+                written += dst.write(view[written:n])
+
+
+def save_temp_bytes(data, suffix, target_dir=None):
+    """Write generated file contents (e.g. a plot) to a temp file and return the path"""
+    fd, temp_path = tempfile.mkstemp(suffix=suffix, dir=target_dir)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
     return temp_path
 
 
+# Cached form choices are rebuilt at least this often (seconds), even if
+# the database files look unchanged
+FORM_CACHE_TTL = 30
+
+
+def _db_stamp(db):
+    """
+    Modification stamp of the database and its WAL file.
+
+    Commits normally change the size or mtime of one of the files, so
+    cached choices are rebuilt straight away. A change can go unseen (a
+    checkpoint rewrites the WAL in place at the same size, and some
+    filesystems such as NFS keep coarse timestamps), so the stamp also
+    moves on every FORM_CACHE_TTL seconds to bound how stale a cache gets.
+    """
+    stamp = [int(time.monotonic() // FORM_CACHE_TTL)]
+    for path in (db.db_path, db.db_path + '-wal'):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+@lru_cache(maxsize=16)
+def _cached_component_ids(db, component_type, stamp):
+    return tuple(Component.list_ids(component_type=component_type, db=db))
+
+
+def form_component_ids(component_type=None):
+    """
+    Component IDs for the upload forms' autocomplete lists.
+
+    Reused across page loads until the database changes (or for at most
+    FORM_CACHE_TTL seconds), so showing a form usually costs two stat calls
+    instead of a components query.
+    """
+    return _cached_component_ids(g.db, component_type, _db_stamp(g.db))
+
+
+@lru_cache(maxsize=4)
+def _cached_install_choices(db, stamp):
+    components = Component.list_ids_and_status(db=db)
+    # Components that are not already installed, and every component
+    return (tuple(cid for cid, status in components if status != 'installed'),
+            tuple(cid for cid, _ in components))
+
+
+def form_install_choices():
+    """
+    (installable IDs, all IDs) for the installation form, cached like
+    form_component_ids until the database changes.
+    """
+    return _cached_install_choices(g.db, _db_stamp(g.db))
+
+
+# Maintenance image shard directories already created by this process
+_maint_dirs = set()
+_maint_dirs_lock = threading.Lock()
+
+
+def maint_shard(component_id):
+    """
+    Shard directory name (two hex digits) for a component's maintenance images.
+
+    Images are spread over at most 256 directories instead of one per
+    component, which keeps directory scans and backups cheap.
+    """
+    return hashlib.blake2b(component_id.encode(), digest_size=1).hexdigest()
+
+
+def ensure_maint_dir(db, shard):
+    """
+    Return data_dir/maintenance/<shard>, creating it if needed.
+
+    Only the first upload to a shard in this process pays for the makedirs
+    call; later ones are a set lookup.
+    """
+    maint_dir = os.path.join(db.data_dir, 'maintenance', shard)
+    with _maint_dirs_lock:
+        if maint_dir not in _maint_dirs:
+            os.makedirs(maint_dir, exist_ok=True)
+            _maint_dirs.add(maint_dir)
+    return maint_dir
+
+
+def remove_temp_dir(temp_dir):
+    """
+    Remove an upload's temp directory and whatever is left in it.
+
+    Uploads and tar extraction write every file flat into the directory
+    (most have been moved into storage by now), so one scandir pass and an
+    unlink per entry is enough; rmtree is only the fallback if something
+    else ended up in there.
+    """
+    try:
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+        os.rmdir(temp_dir)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def remove_temp_dir_later(temp_dir):
+    """
+    Remove an upload's temp directory on the cleanup thread.
+
+    The directory is private to the finished request, so the response does
+    not need to wait for its files to be unlinked.
+    """
+    _cleanup_pool.submit(remove_temp_dir, temp_dir)
+
+
+@lru_cache(maxsize=None)
 def get_current_user():
-    """Get current system username"""
+    """
+    Get current system username
+
+    The server's user does not change while it runs, so the environment and
+    password-database lookup is done once per process.
+    """
     try:
         return getpass.getuser()
     except Exception:
@@ -118,8 +404,7 @@ def picture():
             flash('Component ID is required.', 'danger')
             return redirect(url_for('upload.picture'))
 
-        component = Component.get(component_id, g.db)
-        if not component:
+        if not Component.exists(component_id, g.db):
             flash(f"Component '{component_id}' not found.", 'danger')
             return redirect(url_for('upload.picture'))
 
@@ -128,15 +413,22 @@ def picture():
             flash('No image files selected.', 'danger')
             return redirect(url_for('upload.picture'))
 
-        files = request.files.getlist('image')
-        if not files or all(f.filename == '' for f in files):
+        # Sort the selected files into valid and invalid in one pass
+        valid_files = []
+        invalid_count = 0
+        for f in request.files.getlist('image'):
+            name = f.filename
+            if not name:
+                continue
+            if allowed_image(name):
+                valid_files.append(f)
+            else:
+                invalid_count += 1
+
+        if not valid_files and not invalid_count:
             flash('No image files selected.', 'danger')
             return redirect(url_for('upload.picture'))
 
-        # Filter valid files
-        valid_files = [f for f in files if f.filename != '' and allowed_file(f.filename)]
-        invalid_count = len([f for f in files if f.filename != '' and not allowed_file(f.filename)])
-
         if not valid_files:
             flash(f'No valid image files. Allowed types: {", ".join(ALLOWED_EXTENSIONS)}', 'danger')
             return redirect(url_for('upload.picture'))
@@ -145,35 +437,53 @@ def picture():
         images_dir = os.path.join(g.db.data_dir, 'images', component_id)
         os.makedirs(images_dir, exist_ok=True)
 
-        # Process each file
-        uploaded_count = 0
-        base_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-        with g.db.get_connection() as conn:
-            for idx, file in enumerate(valid_files):
-                # Generate unique filename with timestamp and index
-                original_ext = Path(file.filename).suffix.lower()
-                safe_filename = secure_filename(file.filename)
-                base_name = Path(safe_filename).stem
-                filename = f"{base_timestamp}_{idx:02d}_{base_name}{original_ext}"
-                filepath = os.path.join(images_dir, filename)
-
-                # Save the file
-                file.save(filepath)
-
-                # Store relative path for database
-                rel_path = os.path.relpath(filepath, g.db.data_dir)
-
-                # Save to database
-                conn.execute("""
-                    INSERT INTO component_images
-                    (component_id, image_path, description, uploaded_by, upload_date)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (component_id, rel_path, description or None, uploaded_by,
-                      datetime.now().isoformat()))
-                uploaded_count += 1
+        # Work out where each file goes; the relative path stored in the
+        # database is built directly rather than re-derived from filepath
+        # One timestamp for the whole batch, so all files share an upload date
+        upload_time = datetime.now()
+        base_timestamp = upload_time.strftime('%Y%m%d_%H%M%S')
+        upload_iso = upload_time.isoformat()
+        rel_dir = f"images/{component_id}"
+        uploads = []
+        for idx, file in enumerate(valid_files):
+            # Generate unique filename with timestamp and index; only the
+            # user's stem needs sanitizing (valid files have an allowed
+            # extension) and it is capped to keep paths short
+            stem, _, original_ext = file.filename.rpartition('.')
+            base_name = secure_filename(stem)[:MAX_STORED_STEM_LENGTH]
+            uploads.append((file, f"{base_timestamp}_{idx:02d}_{base_name}",
+                            f".{original_ext.lower()}"))
+
+        # Save the files, then record them all in one statement. A single
+        # file is written inline rather than handed to the pool. Names are
+        # numbered if an upload in the same second already took them
+        def save_upload(upload):
+            file, prefix, ext = upload
+            filename = f"{prefix}{ext}"
+            counter = 1
+            while True:
+                try:
+                    write_new_file(file, f"{images_dir}{os.sep}{filename}")
+                    return f"{rel_dir}/{filename}"
+                except FileExistsError:
+                    filename = f"{prefix}_{counter}{ext}"
+                    counter += 1
 
-            conn.commit()
+        if len(uploads) == 1:
+            rel_paths = [save_upload(uploads[0])]
+        else:
+            rel_paths = list(_save_pool.map(save_upload, uploads))
+
+        with g.db.transaction() as conn:
+            conn.executemany("""
+                INSERT INTO component_images
+                (component_id, image_path, description, uploaded_by, upload_date)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (component_id, rel_path, description or None, uploaded_by, upload_iso)
+                for rel_path in rel_paths
+            ])
+        uploaded_count = len(uploads)
 
         # Build success message
         msg = f'{uploaded_count} image{"s" if uploaded_count > 1 else ""} uploaded successfully for component {component_id}.'
@@ -184,8 +494,7 @@ def picture():
 
     # GET request - show the upload form
     # Get list of component IDs for autocomplete/validation
-    components = Component.list_all(db=g.db)
-    component_ids = [c.id for c in components]
+    component_ids = form_component_ids()
 
     # Check for pre-filled component_id from query parameter
     prefill_component_id = request.args.get('component_id', '')
@@ -242,8 +551,7 @@ def iv_test():
                 flash('Component ID is required.', 'danger')
                 return redirect(url_for('upload.iv_test'))
 
-            component = Component.get(component_id, g.db)
-            if not component:
+            if not Component.exists(component_id, g.db):
                 flash(f"Component '{component_id}' not found.", 'danger')
                 return redirect(url_for('upload.iv_test'))
 
@@ -254,8 +562,7 @@ def iv_test():
             )
 
     # GET request - show the upload form
-    components = Component.list_all(db=g.db)
-    component_ids = [c.id for c in components]
+    component_ids = form_component_ids()
     prefill_component_id = request.args.get('component_id', '')
 
     return render_template('upload/iv_test.html',
@@ -273,7 +580,9 @@ def _handle_single_iv_upload(component_id, raw_data_files, analyzable_extensions
 
     measurements = {}
     files = {}
-    temp_files = []
+    # Every temp file for this upload goes in one directory that is removed
+    # at the end, whatever was moved into storage in between
+    temp_dir = tempfile.mkdtemp(dir=upload_temp_dir(g.db))
 
     try:
         analyzed_file = None
@@ -285,12 +594,11 @@ def _handle_single_iv_upload(component_id, raw_data_files, analyzable_extensions
                     if not allowed_data(f.filename):
                         flash(f"Invalid data file type: {f.filename}", 'warning')
                         continue
-                    temp_path = save_temp_file(f)
+                    temp_path = save_temp_file(f, temp_dir)
                     if temp_path:
                         raw_data_paths.append(temp_path)
-                        temp_files.append(temp_path)
 
-                        ext = Path(f.filename).suffix.lower()
+                        ext = os.path.splitext(f.filename)[1].lower()
                         if analyze_data and iv_analysis_available and ext in analyzable_extensions and not analyzed_file:
                             analyzed_file = temp_path
 
@@ -306,11 +614,7 @@ def _handle_single_iv_upload(component_id, raw_data_files, analyzable_extensions
                 measurements.update(analyzed_measurements)
 
                 if analysis_result['plot_bytes']:
-                    fd, plot_temp_path = tempfile.mkstemp(suffix='.png')
-                    os.close(fd)
-                    with open(plot_temp_path, 'wb') as f:
-                        f.write(analysis_result['plot_bytes'])
-                    temp_files.append(plot_temp_path)
+                    plot_temp_path = save_temp_bytes(analysis_result['plot_bytes'], '.png', temp_dir)
 
                     if 'plot' not in files:
                         files['plot'] = []
@@ -336,7 +640,7 @@ def _handle_single_iv_upload(component_id, raw_data_files, analyzable_extensions
             notes=notes or None
         )
 
-        test_id = test_result.save(g.db)
+        test_id = test_result.save(g.db, move_files=True)
 
         file_count = len(test_result.stored_files) if test_result.stored_files else 0
         msg = f'IV test recorded successfully (Test ID: {test_id})'
@@ -347,12 +651,36 @@ def _handle_single_iv_upload(component_id, raw_data_files, analyzable_extensions
         return redirect(url_for('tests.test_detail', test_id=test_id))
 
     finally:
-        for temp_path in temp_files:
-            try:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-            except Exception:
-                pass
+        remove_temp_dir(temp_dir)
+
+
+def _prepare_bulk_iv_file(f, component_id, analyze, temp_dir, analyze_iv_file):
+    """
+    Save one bulk IV file into temp_dir and run its analysis.
+
+    Runs on the analysis pool. Returns (files, measurements) for TestResult,
+    or None if the upload could not be saved.
+    """
+    # Save file temporarily
+    temp_path = save_temp_file(f, temp_dir)
+    if not temp_path:
+        return None
+
+    measurements = {}
+    files = {'raw_data': [temp_path]}
+
+    # Analyze if enabled
+    if analyze:
+        analysis_result = analyze_iv_file(temp_path, component_id)
+
+        if analysis_result['success']:
+            measurements.update(analysis_result['measurements'])
+
+            if analysis_result['plot_bytes']:
+                plot_temp_path = save_temp_bytes(analysis_result['plot_bytes'], '.png', temp_dir)
+                files['plot'] = [plot_temp_path]
+
+    return files, measurements
 
 
 def _handle_bulk_iv_upload(raw_data_files, analyzable_extensions, analyze_data,
@@ -370,6 +698,9 @@ def _handle_bulk_iv_upload(raw_data_files, analyzable_extensions, analyze_data,
     skipped_files = []
     created_tests = []
 
+    # Validate names and components first; only the files that pass are
+    # saved and analyzed
+    accepted = []
     for f in raw_data_files:
         if f.filename == '':
             continue
@@ -382,8 +713,7 @@ def _handle_bulk_iv_upload(raw_data_files, analyzable_extensions, analyze_data,
             continue
 
         # Check if component exists
-        component = Component.get(component_id, g.db)
-        if not component:
+        if not Component.exists(component_id, g.db):
             skipped_files.append(f"{f.filename} (component {component_id} not found)")
             error_count += 1
             continue
@@ -394,66 +724,84 @@ def _handle_bulk_iv_upload(raw_data_files, analyzable_extensions, analyze_data,
             error_count += 1
             continue
 
-        temp_files = []
-        try:
-            # Save file temporarily
-            temp_path = save_temp_file(f)
-            if not temp_path:
-                skipped_files.append(f"{f.filename} (could not save)")
-                error_count += 1
-                continue
-            temp_files.append(temp_path)
-
-            measurements = {}
-            files = {'raw_data': [temp_path]}
+        ext = os.path.splitext(f.filename)[1].lower()
+        analyze = analyze_data and iv_analysis_available and ext in analyzable_extensions
+        accepted.append((f, component_id, analyze))
 
-            # Analyze if enabled
-            ext = Path(f.filename).suffix.lower()
-            if analyze_data and iv_analysis_available and ext in analyzable_extensions:
-                analysis_result = analyze_iv_file(temp_path, component_id)
+    # Saving, Excel parsing and plotting run concurrently across files;
+    # the test results are then recorded one by one on this thread. All temp
+    # files share one directory that is removed at the end
+    temp_dir = tempfile.mkdtemp(dir=upload_temp_dir(g.db))
 
-                if analysis_result['success']:
-                    measurements.update(analysis_result['measurements'])
-
-                    if analysis_result['plot_bytes']:
-                        fd, plot_temp_path = tempfile.mkstemp(suffix='.png')
-                        os.close(fd)
-                        with open(plot_temp_path, 'wb') as plot_f:
-                            plot_f.write(analysis_result['plot_bytes'])
-                        temp_files.append(plot_temp_path)
-
-                        if 'plot' not in files:
-                            files['plot'] = []
-                        files['plot'].append(plot_temp_path)
+    def prepare(item):
+        f, component_id, analyze = item
+        try:
+            return _prepare_bulk_iv_file(f, component_id, analyze, temp_dir,
+                                         analyze_iv_file)
+        except Exception as e:
+            return e
 
-            # Create test result
-            test_result = TestResult(
-                component_id=component_id,
-                test_type='iv_curve',
-                pass_fail=pass_fail,
-                measurements=measurements if measurements else None,
-                files=files,
-                tested_by=tested_by,
-                test_setup=test_setup or None,
-                test_conditions=test_conditions or None,
-                notes=notes or None
-            )
+    try:
+        if len(accepted) > 1:
+            prepared = list(_analysis_pool.map(prepare, accepted))
+        else:
+            prepared = [prepare(item) for item in accepted]
 
-            test_id = test_result.save(g.db)
-            created_tests.append((component_id, test_id))
-            success_count += 1
+        # Move each result's files into storage before taking the write lock
+        results = []
+        for (f, component_id, _), result in zip(accepted, prepared):
+            if isinstance(result, Exception):
+                skipped_files.append(f"{f.filename} (error: {str(result)})")
+                error_count += 1
+                continue
+            if result is None:
+                skipped_files.append(f"{f.filename} (could not save)")
+                error_count += 1
+                continue
 
-        except Exception as e:
-            skipped_files.append(f"{f.filename} (error: {str(e)})")
-            error_count += 1
+            files, measurements = result
+            try:
+                # Create test result
+                test_result = TestResult(
+                    component_id=component_id,
+                    test_type='iv_curve',
+                    pass_fail=pass_fail,
+                    measurements=measurements if measurements else None,
+                    files=files,
+                    tested_by=tested_by,
+                    test_setup=test_setup or None,
+                    test_conditions=test_conditions or None,
+                    notes=notes or None
+                )
+                test_result.store_files(g.db, move_files=True)
+            except Exception as e:
+                skipped_files.append(f"{f.filename} (error: {str(e)})")
+                error_count += 1
+                continue
+            results.append((f, component_id, test_result))
 
-        finally:
-            for temp_path in temp_files:
-                try:
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-                except Exception:
-                    pass
+        # All results share one transaction (and one commit); each insert
+        # runs in its own savepoint so a failure drops just that file, and
+        # the files stored for it are removed again
+        try:
+            with g.db.transaction() as conn:
+                for f, component_id, test_result in results:
+                    try:
+                        with conn:
+                            test_id = test_result.save(g.db, conn=conn)
+                    except Exception as e:
+                        test_result.remove_stored_files(g.db)
+                        skipped_files.append(f"{f.filename} (error: {str(e)})")
+                        error_count += 1
+                        continue
+                    created_tests.append((component_id, test_id))
+                    success_count += 1
+        except BaseException:
+            for _, _, test_result in results:
+                test_result.remove_stored_files(g.db)
+            raise
+    finally:
+        remove_temp_dir(temp_dir)
 
     # Build summary messages
     if success_count > 0:
@@ -510,8 +858,7 @@ def edge_imaging():
             flash('Component ID is required.', 'danger')
             return redirect(url_for('upload.edge_imaging'))
 
-        component = Component.get(component_id, g.db)
-        if not component:
+        if not Component.exists(component_id, g.db):
             flash(f"Component '{component_id}' not found.", 'danger')
             return redirect(url_for('upload.edge_imaging'))
 
@@ -538,9 +885,10 @@ def edge_imaging():
 
         # Process file uploads
         files = {}
-        temp_files = []  # Track temp files for cleanup
         image_temp_paths = []  # For OCR extraction
         original_filenames = {}  # Map temp paths to original filenames
+        # One temp directory per upload, removed with everything left in it
+        temp_dir = tempfile.mkdtemp(dir=upload_temp_dir(g.db))
 
         try:
             # Edge imaging files (images with embedded measurements)
@@ -552,10 +900,9 @@ def edge_imaging():
                         if not allowed_image(f.filename):
                             flash(f"Invalid image file type: {f.filename}", 'warning')
                             continue
-                        temp_path = save_temp_file(f)
+                        temp_path = save_temp_file(f, temp_dir)
                         if temp_path:
                             image_paths.append(temp_path)
-                            temp_files.append(temp_path)
                             image_temp_paths.append(temp_path)
                             # Store original filename for position extraction
                             original_filenames[temp_path] = f.filename
@@ -604,7 +951,7 @@ def edge_imaging():
                 notes=notes or None
             )
 
-            test_id = test_result.save(g.db)
+            test_id = test_result.save(g.db, move_files=True)
 
             # Build success message
             file_count = len(test_result.stored_files) if test_result.stored_files else 0
@@ -617,16 +964,10 @@ def edge_imaging():
 
         finally:
             # Clean up temp files
-            for temp_path in temp_files:
-                try:
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-                except Exception:
-                    pass
+            remove_temp_dir(temp_dir)
 
     # GET request - show the upload form
-    components = Component.list_all(db=g.db)
-    component_ids = [c.id for c in components]
+    component_ids = form_component_ids()
     prefill_component_id = request.args.get('component_id', '')
 
     return render_template('upload/edge_imaging.html',
@@ -636,10 +977,57 @@ def edge_imaging():
                          ocr_available=ocr_available)
 
 
+# sendfile can write to a regular file only on Linux
+SENDFILE_AVAILABLE = hasattr(os, 'sendfile') and sys.platform.startswith('linux')
+
+
+def _uncompressed_tar_fd(stream):
+    """
+    File descriptor of an upload that is an uncompressed tar on disk.
+
+    Werkzeug spools large uploads to a temporary file; an uncompressed
+    archive there can have its members copied out in the kernel. Returns
+    None for in-memory uploads and compressed archives.
+    """
+    if not SENDFILE_AVAILABLE:
+        return None
+    # Look through SpooledTemporaryFile without forcing it to roll over
+    raw = getattr(stream, '_file', stream)
+    if isinstance(raw, io.BytesIO):
+        return None
+    try:
+        fd = raw.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    # POSIX (ustar) header magic; pread also fails on pipes and sockets
+    try:
+        if os.pread(fd, 5, 257) != b'ustar':
+            return None
+    except OSError:
+        return None
+    return fd
+
+
+def _sendfile_member(dst, src_fd, offset, size):
+    """Copy size bytes at offset in src_fd to dst without passing through Python"""
+    out_fd = dst.fileno()
+    while size > 0:
+        sent = os.sendfile(out_fd, src_fd, offset, size)
+        if sent == 0:
+            raise tarfile.ReadError("unexpected end of data")
+        offset += sent
+        size -= sent
+
+
 def extract_images_from_tar(tar_file, temp_dir, data_input):
     """
     Extract image files from a tar archive.
 
+    The archive is read straight from the upload stream in streaming mode,
+    so it is never saved to disk first and members are copied out in
+    fixed-size chunks as they are decoded. Uncompressed archives that
+    Werkzeug spooled to disk are read in place and copied with sendfile.
+
     Args:
         tar_file: Werkzeug FileStorage object
         temp_dir: Directory to extract files to
@@ -653,23 +1041,22 @@ def extract_images_from_tar(tar_file, temp_dir, data_input):
     if not tar_file or tar_file.filename == '':
         return images
 
-    # Save tar to temp first
-    tar_temp_path = os.path.join(temp_dir, secure_filename(tar_file.filename))
-    tar_file.save(tar_temp_path)
+    src_fd = _uncompressed_tar_fd(tar_file.stream)
 
     try:
-        with tarfile.open(tar_temp_path, mode='r:*') as tf:
-            for member in tf.getmembers():
-                if not member.isfile():
+        with tarfile.open(fileobj=tar_file.stream,
+                          mode='r|*' if src_fd is None else 'r:') as tf:
+            for member in tf:
+                if not member.isfile() or member.size > MAX_TAR_MEMBER_BYTES:
                     continue
 
                 # Check if it's an image file
-                ext = Path(member.name).suffix.lower().lstrip('.')
-                if ext not in ALLOWED_IMAGE_EXTENSIONS:
+                if not allowed_image(member.name):
                     continue
 
                 # Extract to temp directory
-                # Use a safe filename to avoid path traversal
+                # Use a safe filename to avoid path traversal; temp_dir is
+                # ours, so a separator-free name cannot escape it
                 safe_name = secure_filename(os.path.basename(member.name))
                 if not safe_name:
                     continue
@@ -679,10 +1066,11 @@ def extract_images_from_tar(tar_file, temp_dir, data_input):
                 extract_path = os.path.join(temp_dir, unique_name)
 
                 # Extract the file
-                with tf.extractfile(member) as src:
-                    if src:
-                        with open(extract_path, 'wb') as dst:
-                            dst.write(src.read())
+                with open(extract_path, 'wb') as dst:
+                    if src_fd is not None and not member.issparse():
+                        _sendfile_member(dst, src_fd, member.offset_data, member.size)
+                    else:
+                        shutil.copyfileobj(tf.extractfile(member), dst, COPY_BUFFER_SIZE)
 
                 # Create metadata for this file
                 metadata = {
@@ -695,14 +1083,41 @@ def extract_images_from_tar(tar_file, temp_dir, data_input):
     except tarfile.TarError as e:
         # Invalid tar file - will be handled by caller
         raise ValueError(f"Invalid tar file for {data_input}: {str(e)}")
-    finally:
-        # Clean up the tar file
-        if os.path.exists(tar_temp_path):
-            os.remove(tar_temp_path)
 
     return images
 
 
+def _save_flange_qc_test(component_id, all_files, file_counts, feb_serial,
+                         pass_fail, tested_by, notes):
+    """Record a flange QC test for the extracted plots and return its ID"""
+    # Build measurements dict
+    measurements = {
+        'feb_serial': feb_serial,
+        'j1_file_count': file_counts['J1'],
+        'j3_file_count': file_counts['J3'],
+        'j5_file_count': file_counts['J5']
+    }
+
+    # Prepare files dict for TestResult, with each plot's metadata
+    # stored alongside it
+    plot_paths = [f[0] for f in all_files]
+    file_metadata = {f[0]: f[1] for f in all_files}
+
+    # Create test result
+    test_result = TestResult(
+        component_id=component_id,
+        test_type='flange_qc_test',
+        pass_fail=pass_fail,
+        measurements=measurements,
+        files={'plot': plot_paths} if plot_paths else None,
+        file_metadata=file_metadata,
+        tested_by=tested_by,
+        notes=notes or None
+    )
+
+    return test_result.save(g.db, move_files=True)
+
+
 @upload_bp.route('/flange-qc', methods=['GET', 'POST'])
 def flange_qc():
     """Upload a flange board QC test result with O20 plots for each data input (J1, J3, J5)"""
@@ -726,17 +1141,18 @@ def flange_qc():
             flash('Component ID is required.', 'danger')
             return redirect(url_for('upload.flange_qc'))
 
-        component = Component.get(component_id, g.db)
-        if not component:
+        component_type = Component.get_type(component_id, g.db)
+        if not component_type:
             flash(f"Component '{component_id}' not found.", 'danger')
             return redirect(url_for('upload.flange_qc'))
 
-        if component.type != 'flange_board':
-            flash(f"Component '{component_id}' is not a flange board (type: {component.type}).", 'danger')
+        if component_type != 'flange_board':
+            flash(f"Component '{component_id}' is not a flange board (type: {component_type}).", 'danger')
             return redirect(url_for('upload.flange_qc'))
 
-        # Create temp directory for extraction
-        temp_dir = tempfile.mkdtemp()
+        # Create temp directory for extraction next to data storage, so the
+        # extracted plots are renamed into place rather than copied
+        temp_dir = tempfile.mkdtemp(dir=upload_temp_dir(g.db))
 
         try:
             # Process tar files for each data input
@@ -760,79 +1176,8 @@ def flange_qc():
                 flash('No valid image files found in any of the tar files.', 'danger')
                 return redirect(url_for('upload.flange_qc'))
 
-            # Build measurements dict
-            measurements = {
-                'feb_serial': feb_serial,
-                'j1_file_count': file_counts['J1'],
-                'j3_file_count': file_counts['J3'],
-                'j5_file_count': file_counts['J5']
-            }
-
-            # Prepare files dict for TestResult
-            # We need to use a custom approach to attach metadata to each file
-            plot_paths = [f[0] for f in all_files]
-            file_metadata = {f[0]: f[1] for f in all_files}
-
-            # Create test result
-            test_result = TestResult(
-                component_id=component_id,
-                test_type='flange_qc_test',
-                pass_fail=pass_fail,
-                measurements=measurements,
-                files={'plot': plot_paths} if plot_paths else None,
-                tested_by=tested_by,
-                notes=notes or None
-            )
-
-            # Store the file metadata for later use
-            test_result._file_metadata = file_metadata
-
-            test_id = test_result.save(g.db)
-
-            # Now update the test_files records with metadata
-            # Match files by their data_input prefix in the original_filename
-            with g.db.get_connection() as conn:
-                # Get all files for this test
-                files = conn.execute("""
-                    SELECT id, original_filename FROM test_files WHERE test_id = ?
-                """, (test_id,)).fetchall()
-
-                for file_row in files:
-                    file_id = file_row['id']
-                    original_filename = file_row['original_filename']
-
-                    # Determine data_input from filename prefix (J1_, J3_, or J5_)
-                    data_input = None
-                    for di in ['J1', 'J3', 'J5']:
-                        if original_filename.startswith(f"{di}_"):
-                            data_input = di
-                            # Get the original name without the prefix
-                            orig_name = original_filename[len(f"{di}_"):]
-                            break
-
-                    if data_input:
-                        # Find the matching metadata from the temp file
-                        for temp_path, metadata in file_metadata.items():
-                            if os.path.basename(temp_path) == original_filename:
-                                conn.execute("""
-                                    UPDATE test_files
-                                    SET metadata_json = ?
-                                    WHERE id = ?
-                                """, (json.dumps(metadata), file_id))
-                                break
-                        else:
-                            # If no exact match found, create metadata from filename
-                            metadata = {
-                                'data_input': data_input,
-                                'original_name': orig_name
-                            }
-                            conn.execute("""
-                                UPDATE test_files
-                                SET metadata_json = ?
-                                WHERE id = ?
-                            """, (json.dumps(metadata), file_id))
-
-                conn.commit()
+            test_id = _save_flange_qc_test(component_id, all_files, file_counts,
+                                           feb_serial, pass_fail, tested_by, notes)
 
             # Build success message
             total_files = sum(file_counts.values())
@@ -844,14 +1189,11 @@ def flange_qc():
 
         finally:
             # Clean up temp directory
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+            remove_temp_dir_later(temp_dir)
 
     # GET request - show the upload form
     # Filter to only show flange_board components
-    components = Component.list_all(db=g.db)
-    flange_components = [c for c in components if c.type == 'flange_board']
-    component_ids = [c.id for c in flange_components]
+    component_ids = form_component_ids('flange_board')
     prefill_component_id = request.args.get('component_id', '')
 
     return render_template('upload/flange_qc.html',
@@ -859,6 +1201,59 @@ def flange_qc():
                          prefill_component_id=prefill_component_id)
 
 
+@upload_bp.route('/flange-qc/<component_id>/<data_input>', methods=['PUT'])
+def flange_qc_raw(component_id, data_input):
+    """
+    Record a flange QC test from a raw tar upload for one data input.
+
+    Meant for test bench scripts, e.g.::
+
+        curl -T plots.tar "<server>/upload/flange-qc/FLANGE-01/J1?feb_serial=F12"
+
+    The request body is the tar archive itself and is extracted straight
+    from the request stream, so large archives are never spooled to disk
+    by the multipart parser. The other fields (tested_by, feb_serial,
+    notes, pass_fail) come from the query string.
+    """
+    if data_input not in ('J1', 'J3', 'J5'):
+        return jsonify(error=f"Unknown data input '{data_input}' (expected J1, J3 or J5)"), 404
+
+    component_type = Component.get_type(component_id, g.db)
+    if not component_type:
+        return jsonify(error=f"Component '{component_id}' not found."), 404
+    if component_type != 'flange_board':
+        return jsonify(error=f"Component '{component_id}' is not a flange board (type: {component_type})."), 400
+
+    pass_fail_value = request.args.get('pass_fail', '')
+    pass_fail = {'pass': True, 'fail': False}.get(pass_fail_value)
+
+    tar_file = FileStorage(stream=request.stream,
+                           filename=request.args.get('filename') or f"{data_input}.tar")
+
+    temp_dir = tempfile.mkdtemp(dir=upload_temp_dir(g.db))
+    try:
+        try:
+            extracted = extract_images_from_tar(tar_file, temp_dir, data_input)
+        except ValueError as e:
+            return jsonify(error=str(e)), 400
+
+        if not extracted:
+            return jsonify(error='No valid image files found in the tar file.'), 400
+
+        file_counts = {'J1': 0, 'J3': 0, 'J5': 0}
+        file_counts[data_input] = len(extracted)
+        test_id = _save_flange_qc_test(
+            component_id, extracted, file_counts,
+            request.args.get('feb_serial', '').strip(), pass_fail,
+            request.args.get('tested_by', '').strip() or get_current_user(),
+            request.args.get('notes', '').strip())
+    finally:
+        remove_temp_dir_later(temp_dir)
+
+    return jsonify(test_id=test_id, file_counts=file_counts,
+                   url=url_for('tests.test_detail', test_id=test_id)), 201
+
+
 @upload_bp.route('/noise-test', methods=['GET', 'POST'])
 def noise_test():
     """Upload a noise test result with plots from a tar file"""
@@ -884,13 +1279,13 @@ def noise_test():
             flash('Component ID is required.', 'danger')
             return redirect(url_for('upload.noise_test'))
 
-        component = Component.get(component_id, g.db)
-        if not component:
+        component_type = Component.get_type(component_id, g.db)
+        if not component_type:
             flash(f"Component '{component_id}' not found.", 'danger')
             return redirect(url_for('upload.noise_test'))
 
-        if component.type != 'hybrid':
-            flash(f"Component '{component_id}' is not a hybrid (type: {component.type}).", 'danger')
+        if component_type != 'hybrid':
+            flash(f"Component '{component_id}' is not a hybrid (type: {component_type}).", 'danger')
             return redirect(url_for('upload.noise_test'))
 
         # Get tar file
@@ -899,8 +1294,9 @@ def noise_test():
             flash('Please upload a tar file containing plots.', 'danger')
             return redirect(url_for('upload.noise_test'))
 
-        # Create temp directory for extraction
-        temp_dir = tempfile.mkdtemp()
+        # Create temp directory for extraction next to data storage, so the
+        # extracted plots are renamed into place rather than copied
+        temp_dir = tempfile.mkdtemp(dir=upload_temp_dir(g.db))
 
         try:
             # Extract images from tar with optional filtering
@@ -935,7 +1331,7 @@ def noise_test():
                 notes=notes or None
             )
 
-            test_id = test_result.save(g.db)
+            test_id = test_result.save(g.db, move_files=True)
 
             # Build success message
             msg = f'Noise test recorded (Test ID: {test_id}) with {len(extracted_files)} plot(s)'
@@ -947,14 +1343,11 @@ def noise_test():
 
         finally:
             # Clean up temp directory
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+            remove_temp_dir_later(temp_dir)
 
     # GET request - show the upload form
     # Filter to only show hybrid components
-    components = Component.list_all(db=g.db)
-    hybrid_components = [c for c in components if c.type == 'hybrid']
-    component_ids = [c.id for c in hybrid_components]
+    component_ids = form_component_ids('hybrid')
     prefill_component_id = request.args.get('component_id', '')
 
     return render_template('upload/noise_test.html',
@@ -966,6 +1359,9 @@ def extract_filtered_images_from_tar(tar_file, temp_dir, file_filter=None):
     """
     Extract image files from a tar archive with optional filename filtering.
 
+    Like extract_images_from_tar, the archive is read straight from the
+    upload stream in streaming mode rather than being saved to disk first.
+
     Args:
         tar_file: Werkzeug FileStorage object
         temp_dir: Directory to extract files to
@@ -979,26 +1375,29 @@ def extract_filtered_images_from_tar(tar_file, temp_dir, file_filter=None):
     if not tar_file or tar_file.filename == '':
         return images
 
-    # Save tar to temp first
-    tar_temp_path = os.path.join(temp_dir, secure_filename(tar_file.filename))
-    tar_file.save(tar_temp_path)
+    # Names already extracted; temp_dir starts out empty, so there is no
+    # need to stat the filesystem for collisions
+    used_names = set()
+    filter_lc = file_filter.lower() if file_filter else None
+
+    src_fd = _uncompressed_tar_fd(tar_file.stream)
 
     try:
-        with tarfile.open(tar_temp_path, mode='r:*') as tf:
-            for member in tf.getmembers():
-                if not member.isfile():
+        with tarfile.open(fileobj=tar_file.stream,
+                          mode='r|*' if src_fd is None else 'r:') as tf:
+            for member in tf:
+                if not member.isfile() or member.size > MAX_TAR_MEMBER_BYTES:
                     continue
 
                 # Get basename
                 basename = os.path.basename(member.name)
 
                 # Apply filter if specified
-                if file_filter and file_filter.lower() not in basename.lower():
+                if filter_lc and filter_lc not in basename.lower():
                     continue
 
                 # Check if it's an image file
-                ext = Path(member.name).suffix.lower().lstrip('.')
-                if ext not in ALLOWED_IMAGE_EXTENSIONS:
+                if not allowed_image(member.name):
                     continue
 
                 # Extract to temp directory
@@ -1006,29 +1405,27 @@ def extract_filtered_images_from_tar(tar_file, temp_dir, file_filter=None):
                 if not safe_name:
                     continue
 
-                extract_path = os.path.join(temp_dir, safe_name)
-
                 # Handle duplicate filenames
+                unique_name = safe_name
                 counter = 1
                 base, extension = os.path.splitext(safe_name)
-                while os.path.exists(extract_path):
-                    extract_path = os.path.join(temp_dir, f"{base}_{counter}{extension}")
+                while unique_name in used_names:
+                    unique_name = f"{base}_{counter}{extension}"
                     counter += 1
+                used_names.add(unique_name)
+                extract_path = os.path.join(temp_dir, unique_name)
 
                 # Extract the file
-                with tf.extractfile(member) as src:
-                    if src:
-                        with open(extract_path, 'wb') as dst:
-                            dst.write(src.read())
+                with open(extract_path, 'wb') as dst:
+                    if src_fd is not None and not member.issparse():
+                        _sendfile_member(dst, src_fd, member.offset_data, member.size)
+                    else:
+                        shutil.copyfileobj(tf.extractfile(member), dst, COPY_BUFFER_SIZE)
 
                 images.append((extract_path, basename))
 
     except tarfile.TarError as e:
         raise ValueError(f"Error reading tar file: {e}")
-    finally:
-        # Remove the temp tar file
-        if os.path.exists(tar_temp_path):
-            os.remove(tar_temp_path)
 
     return images
 
@@ -1037,6 +1434,15 @@ def extract_filtered_images_from_tar(tar_file, temp_dir, file_filter=None):
 def maintenance():
     """Upload a maintenance log entry / comment for a component"""
     if request.method == 'POST':
+        # Every validation failure redirects back to the form
+        self_url = url_for('upload.maintenance')
+
+        # Check the declared size before request.form/files read the body
+        content_length = request.content_length
+        if content_length and content_length > MAX_MAINTENANCE_UPLOAD_BYTES:
+            flash(f'Upload too large (limit {MAX_MAINTENANCE_UPLOAD_BYTES // (1024 * 1024)} MB).', 'danger')
+            return redirect(self_url)
+
         # Get form data
         component_id = request.form.get('component_id', '').strip()
         description = request.form.get('description', '').strip()
@@ -1047,48 +1453,57 @@ def maintenance():
         # Validate required fields
         if not component_id:
             flash('Component ID is required.', 'danger')
-            return redirect(url_for('upload.maintenance'))
+            return redirect(self_url)
 
         if not description:
             flash('Description/comment is required.', 'danger')
-            return redirect(url_for('upload.maintenance'))
-
-        # Validate component exists
-        component = Component.get(component_id, g.db)
-        if not component:
-            flash(f"Component '{component_id}' not found.", 'danger')
-            return redirect(url_for('upload.maintenance'))
+            return redirect(self_url)
 
         # Handle optional image upload
         image_rel_path = None
         if 'image' in request.files:
             file = request.files['image']
             if file and file.filename != '':
-                if not allowed_image(file.filename):
+                # The sanitized extension doubles as the type check
+                base_name, original_ext = split_safe_filename(file.filename)
+                if original_ext[1:] not in ALLOWED_IMAGE_EXTENSIONS:
                     flash(f'Invalid image file type. Allowed: {", ".join(ALLOWED_IMAGE_EXTENSIONS)}', 'danger')
-                    return redirect(url_for('upload.maintenance'))
+                    return redirect(self_url)
 
-                # Create storage directory: data_dir/maintenance/component_id/
-                maint_dir = os.path.join(g.db.data_dir, 'maintenance', component_id)
-                os.makedirs(maint_dir, exist_ok=True)
+                # component_id becomes part of the stored filename, so it
+                # must not be able to leave the maintenance directory
+                if '/' in component_id or os.sep in component_id or '..' in component_id:
+                    flash(f"Invalid component ID '{component_id}' for file storage.", 'danger')
+                    return redirect(self_url)
 
-                # Generate unique filename with timestamp
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                original_ext = Path(file.filename).suffix.lower()
-                safe_filename = secure_filename(file.filename)
-                base_name = Path(safe_filename).stem
-                filename = f"{timestamp}_{base_name}{original_ext}"
-                filepath = os.path.join(maint_dir, filename)
+                # Storage directory: data_dir/maintenance/<shard>/
+                shard = maint_shard(component_id)
+                maint_dir = ensure_maint_dir(g.db, shard)
 
-                # Save the file
-                file.save(filepath)
+                # Generate unique filename with component ID and timestamp
+                prefix = f"{component_id}_{time.strftime('%Y%m%d_%H%M%S')}_{base_name}"
+                filename = f"{prefix}{original_ext}"
+
+                # Save the file, numbering it if another upload in the same
+                # second already took the name
+                counter = 1
+                while True:
+                    try:
+                        write_new_file(file, os.path.join(maint_dir, filename))
+                        break
+                    except FileExistsError:
+                        filename = f"{prefix}_{counter}{original_ext}"
+                        counter += 1
+                    except FileNotFoundError:
+                        # Directory was removed since it was first created
+                        os.makedirs(maint_dir, exist_ok=True)
 
                 # Store relative path for database
-                image_rel_path = os.path.relpath(filepath, g.db.data_dir)
+                image_rel_path = f"maintenance/{shard}/{filename}"
 
         try:
             # Add maintenance log entry
-            log_id = add_maintenance_log(
+            add_maintenance_log(
                 component_id=component_id,
                 description=description,
                 log_type=log_type,
@@ -1097,21 +1512,26 @@ def maintenance():
                 image_path=image_rel_path,
                 db=g.db
             )
-
-            # Build success message
-            msg = f'Comment added successfully for component {component_id}'
+        except Exception as e:
+            # No log entry refers to the image (the component may not even
+            # exist), so don't keep it
             if image_rel_path:
-                msg += ' with attached image'
-            flash(msg, 'success')
-            return redirect(url_for('components.component_detail', component_id=component_id))
+                with suppress(FileNotFoundError):
+                    os.remove(os.path.join(maint_dir, filename))
+            if isinstance(e, ValueError):
+                flash(str(e), 'danger')
+                return redirect(self_url)
+            raise
 
-        except ValueError as e:
-            flash(str(e), 'danger')
-            return redirect(url_for('upload.maintenance'))
+        # Build success message
+        msg = f'Comment added successfully for component {component_id}'
+        if image_rel_path:
+            msg += ' with attached image'
+        flash(msg, 'success')
+        return redirect(url_for('components.component_detail', component_id=component_id))
 
     # GET request - show the upload form
-    components = Component.list_all(db=g.db)
-    component_ids = [c.id for c in components]
+    component_ids = form_component_ids()
     prefill_component_id = request.args.get('component_id', '')
 
     return render_template('upload/maintenance.html',
@@ -1121,31 +1541,54 @@ def maintenance():
 
 
 # Standard position options for the detector
-LAYER_POSITIONS = []
 # Layers 0-3: LayerN_{top/bottom}_{axial/stereo}
-for layer in range(4):
-    for tb in ['top', 'bottom']:
-        for orientation in ['axial', 'stereo']:
-            LAYER_POSITIONS.append(f"Layer{layer}_{tb}_{orientation}")
-
 # Layers 4-7: LayerN_{top/bottom}_{axial/stereo}_{slot/hole}
-for layer in range(4, 8):
-    for tb in ['top', 'bottom']:
-        for orientation in ['axial', 'stereo']:
-            for position in ['slot', 'hole']:
-                LAYER_POSITIONS.append(f"Layer{layer}_{tb}_{orientation}_{position}")
+LAYER_POSITIONS = tuple(
+    f"Layer{layer}_{tb}_{orientation}"
+    for layer in range(4)
+    for tb in ('top', 'bottom')
+    for orientation in ('axial', 'stereo')
+) + tuple(
+    f"Layer{layer}_{tb}_{orientation}_{position}"
+    for layer in range(4, 8)
+    for tb in ('top', 'bottom')
+    for orientation in ('axial', 'stereo')
+    for position in ('slot', 'hole')
+)
 
 # FEB positions
-FEB_POSITIONS = [f"FEB{i}" for i in range(1, 13)]
+FEB_POSITIONS = tuple(f"FEB{i}" for i in range(1, 13))
 
 # Flange positions
-FLANGE_POSITIONS = [f"Flange_slot{i}" for i in range(4)]
+FLANGE_POSITIONS = tuple(f"Flange_slot{i}" for i in range(4))
+
+
+def _position_options(positions):
+    """Render positions as <option> tags for the installation form"""
+    return Markup('\n'.join(
+        f'<option value="{escape(pos)}">{escape(pos)}</option>' for pos in positions
+    ))
+
+
+# The position lists never change, so their <option> markup is built once
+# here instead of looping in the template on every request. Layers 0-3 have
+# no slot/hole variants and come first in LAYER_POSITIONS
+_INNER_LAYER_COUNT = 4 * 2 * 2
+POSITION_OPTIONS = {
+    'inner_layers': _position_options(LAYER_POSITIONS[:_INNER_LAYER_COUNT]),
+    'outer_layers': _position_options(LAYER_POSITIONS[_INNER_LAYER_COUNT:]),
+    'febs': _position_options(FEB_POSITIONS),
+    'flanges': _position_options(FLANGE_POSITIONS),
+}
 
 
 @upload_bp.route('/installation', methods=['GET', 'POST'])
 def installation():
     """Record installation of a component"""
     if request.method == 'POST':
+        # Every validation failure redirects back to the form
+        self_url = url_for('upload.installation')
+
         # Get form data
         component_id = request.form.get('component_id', '').strip()
         position = request.form.get('position', '').strip()
@@ -1158,30 +1601,26 @@ def installation():
         if custom_position:
             position = custom_position
 
-        # Validate required fields
-        if not component_id:
-            flash('Component ID is required.', 'danger')
-            return redirect(url_for('upload.installation'))
-
-        if not position:
-            flash('Position is required.', 'danger')
-            return redirect(url_for('upload.installation'))
-
-        if not run_period:
-            flash('Run period is required.', 'danger')
-            return redirect(url_for('upload.installation'))
+        # Validate required fields, reporting the first one missing
+        for label, value in (('Component ID', component_id),
+                             ('Position', position),
+                             ('Run period', run_period)):
+            if not value:
+                flash(f'{label} is required.', 'danger')
+                return redirect(self_url)
 
         # Validate component exists
-        component = Component.get(component_id, g.db)
-        if not component:
+        install_state = Component.get_install_state(component_id, g.db)
+        if install_state is None:
             flash(f"Component '{component_id}' not found.", 'danger')
-            return redirect(url_for('upload.installation'))
+            return redirect(self_url)
 
         # Check if component is already installed
-        if component.installation_status == 'installed':
-            flash(f"Component '{component_id}' is already installed at {component.installed_position}. "
+        installation_status, installed_position = install_state
+        if installation_status == 'installed':
+            flash(f"Component '{component_id}' is already installed at {installed_position}. "
                   "Remove it first before installing at a new position.", 'warning')
-            return redirect(url_for('upload.installation'))
+            return redirect(self_url)
 
         try:
             install_component(
@@ -1198,14 +1637,10 @@ def installation():
 
         except ValueError as e:
             flash(str(e), 'danger')
-            return redirect(url_for('upload.installation'))
+            return redirect(self_url)
 
     # GET request - show the form
-    components = Component.list_all(db=g.db)
-    # Filter to components that are not already installed
-    available_components = [c for c in components if c.installation_status != 'installed']
-    component_ids = [c.id for c in available_components]
-    all_component_ids = [c.id for c in components]
+    component_ids, all_component_ids = form_install_choices()
 
     prefill_component_id = request.args.get('component_id', '')
 
@@ -1213,6 +1648,4 @@ def installation():
                          component_ids=component_ids,
                          all_component_ids=all_component_ids,
                          prefill_component_id=prefill_component_id,
-                         layer_positions=LAYER_POSITIONS,
-                         feb_positions=FEB_POSITIONS,
-                         flange_positions=FLANGE_POSITIONS)
+                         position_options=POSITION_OPTIONS)